@@ -1,31 +1,38 @@
 """
 Processing related functions
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum, auto
-from typing import Any, Callable, List, Union, Type, Tuple
-
-from pandas import DataFrame, concat
+from functools import lru_cache, partial
+from random import uniform
+from threading import Lock
+from time import sleep
+from typing import Any, Callable, Iterator, List, Set, Union, Type, Tuple
+
+import numpy as np
+from pandas import DataFrame, Timestamp, concat, to_datetime
 from stock import (
     get_stock_param_range, download_stock_data,
     analyse_stock, download_exchanges, download_companies,
     Company, AnalysisRange, DATE_FORM, StockParam, DataMode, CompanyColumn,
-    StockDownload
+    StockDownload, DfColumn
 )
 from sheets import (
-    save_stock_data, get_sheets_data, save_exchanges, save_companies,
-    search_company, check_partial, del_stock_sheets
+    save_stock_data, get_sheets_data, get_sheets_data_bulk, save_exchanges,
+    save_companies, search_company, check_partial, del_stock_sheets
 )
 from utils import (
     CloseMenuEntry, Menu, MenuEntry, ProxyMenuEntry, info, BACK_KEY,
     ControlCode, get_input, title, user_confirm, get_int, valid_int_range,
     save_json_file, sample_exchange_path, MAX_MULTI_ANALYSIS, Spacing,
-    colorise, Colour, error
+    colorise, Colour, error, max_workers, Pagination, ttl_lru_cache
 )
 from .input import (
     get_stock_param_symbol, get_stock_param, get_stock_param_symbol_or_search,
     multi_stock_marker
 )
 from .results import display_analysis
+from .cache import read_cached_stock_data, cache_stock_data, clear_cache
 
 DATE_ENTRY = 'Date entry'
 TEXT_ENTRY = 'Text entry'
@@ -45,27 +52,65 @@ NUM_STOCKS_HELP = "Enter the number of stocks to analyse"
 
 ENABLE_SAVE_SAMPLES = False
 
+MAX_RETRY_DELAY = 30
+""" Max delay in seconds before retrying a download """
 
-def stock_analysis_menu():
+SEARCH_CACHE_TTL = 30 * 60
+"""
+Time to live in seconds of cached search results, as sheets may be
+updated by other users
+"""
+
+_SAVE_LOCK = Lock()
+""" Lock for saving stock data """
+
+_PROXY_SENTINEL = ProxyMenuEntry()
+"""
+Shared search results placeholder; proxies hold no state and are replaced
+before being displayed
+"""
+
+
+@lru_cache(maxsize=None)
+def _stock_analysis_menu() -> Menu:
     """
-    Stock analysis menu
+    Generate the stock analysis menu
 
     Returns:
-        bool: Truthy if processed, otherwise Falsy
+        Menu: menu
     """
-    stock_menu: Menu = Menu(
+    return Menu(
         MenuEntry('Single stock', process_stock_menu),
         MenuEntry('Multiple stocks', process_multi_stock),
         CloseMenuEntry('Back'),
         menu_title='Stock Analysis Menu'
     )
-    loop: bool = True
-    while loop:
-        result = stock_menu.process()
 
-        loop = stock_menu.is_open
 
-    return result
+def stock_analysis_menu():
+    """
+    Stock analysis menu
+
+    Returns:
+        bool: Truthy if processed, otherwise Falsy
+    """
+    return _stock_analysis_menu().run_until_closed()
+
+
+@lru_cache(maxsize=None)
+def _period_entry_menu() -> Menu:
+    """
+    Generate the period entry method menu
+
+    Returns:
+        Menu: menu
+    """
+    return Menu(
+        CloseMenuEntry(DATE_ENTRY, lambda: AnalysisRange.DATE),
+        CloseMenuEntry(TEXT_ENTRY, lambda: AnalysisRange.PERIOD),
+        menu_title='Period Entry Method',
+        help_text=PERIOD_MENU_HELP
+    )
 
 
 def period_entry_menu() -> Union[AnalysisRange, None]:
@@ -75,29 +120,28 @@ def period_entry_menu() -> Union[AnalysisRange, None]:
     Returns:
         AnalysisRange: entry method
     """
-    result = AnalysisRange.ASK
-
-    def set_date_entry():
-        nonlocal result
-        result = AnalysisRange.DATE
+    return _period_entry_menu().run_until_closed()
 
-    def set_period_entry():
-        nonlocal result
-        result = AnalysisRange.PERIOD
 
-    period_menu: Menu = Menu(
-        CloseMenuEntry(DATE_ENTRY, set_date_entry),
-        CloseMenuEntry(TEXT_ENTRY, set_period_entry),
-        menu_title='Period Entry Method',
-        help_text=PERIOD_MENU_HELP
-    )
-    loop: bool = True
-    while loop:
-        result = period_menu.process()
+@lru_cache(maxsize=8)
+def _stock_selection_menu(
+            symbol_func: Callable[[], Any],
+            search_func: Callable[[], Any]) -> Menu:
+    """
+    Generate the stock selection method menu
 
-        loop = period_menu.is_open
+    Args:
+        symbol_func (Callable[[], Any]): Function to call for symbol entry
+        search_func (Callable[[], Any]): Function to call for symbol search
 
-    return result
+    Returns:
+        Menu: menu
+    """
+    return Menu(
+        CloseMenuEntry(SYMBOL_ENTRY, symbol_func),
+        CloseMenuEntry(SEARCH_ENTRY, search_func),
+        help_text=SYMBOL_MENU_HELP
+    )
 
 
 def process_stock_menu(index: int = None, num_stocks: int = None,
@@ -117,26 +161,15 @@ def process_stock_menu(index: int = None, num_stocks: int = None,
     Returns:
         Any: Truthy if processed, otherwise Falsy
     """
-    if symbol_func is None:
-        symbol_func = process_stock
-    if search_func is None:
-        search_func = company_name_search
+    # menus are generated once and reused
+    symbol_menu = _stock_selection_menu(
+        symbol_func if symbol_func else process_stock,
+        search_func if search_func else company_name_search)
 
     stock_idx = multi_stock_marker(index=index, num_stocks=num_stocks)
-    symbol_menu: Menu = Menu(
-        CloseMenuEntry(SYMBOL_ENTRY, symbol_func),
-        CloseMenuEntry(SEARCH_ENTRY, search_func),
-        menu_title=f'Stock Selection Method{stock_idx}',
-        help_text=SYMBOL_MENU_HELP
-    )
-    selection = None
-    loop: bool = True
-    while loop:
-        selection = symbol_menu.process()
+    symbol_menu.set_title(f'Stock Selection Method{stock_idx}')
 
-        loop = symbol_menu.is_open
-
-    return selection
+    return symbol_menu.run_until_closed()
 
 
 class MultiLevel(Enum):
@@ -176,10 +209,13 @@ def process_multi_stock() -> Union[bool, ControlCode]:
             continue
 
         elif level == MultiLevel.STOCKS:
-            # get stock symbols
+            # get stock symbols; entries are set by index so any from an
+            # abandoned pass are discarded
+            stock_params = [None] * num_stocks
+            entered = set()
             for idx in range(num_stocks):
 
-                selection = get_stock_symbols(idx, num_stocks, stock_params)
+                selection = get_stock_symbols(idx, num_stocks, entered)
 
                 if selection == ControlCode.BACK:
                     level = MultiLevel.NUM_STOCKS
@@ -188,7 +224,8 @@ def process_multi_stock() -> Union[bool, ControlCode]:
                     result = selection
                     break
 
-                stock_params.append(selection)
+                stock_params[idx] = selection
+                entered.add(selection.symbol)
             else:
                 level = MultiLevel.PERIOD
             continue
@@ -203,30 +240,32 @@ def process_multi_stock() -> Union[bool, ControlCode]:
                 result = stock1_param
             elif stock1_param == ControlCode.BACK:
                 level = MultiLevel.STOCKS
-                stock_params.clear()
             else:
-                for idx in range(1, num_stocks):
+                for stock_param in stock_params[1:]:
                     # copy same period to all params
-                    stock_params[idx].set_dates(stock1_param)
+                    stock_param.set_dates(stock1_param)
 
                 level = MultiLevel.ANALYSE
             continue
 
         elif level == MultiLevel.ANALYSE:
             # analyse stocks and display
-            analysis = []
-            for idx in range(num_stocks):
-                stock_param = stock_params[idx]
-
-                data_frame = get_sheets_data(stock_param)
-
-                # check for gaps in data
-                data_frame = fill_gaps(data_frame, stock_param)
-
-                if data_frame is not None and not data_frame.empty:
-                    analysis.append(
-                        analyse_stock(data_frame, stock_param)
-                    )
+            # only fetch & analyse each symbol once
+            unique = {}
+            for stock_param in stock_params:
+                unique.setdefault(stock_param.symbol, stock_param)
+
+            analysed = {
+                stock_param.symbol: stock_result
+                for stock_param, stock_result in zip(
+                    unique.values(),
+                    analyse_stocks_data(list(unique.values())))
+                if stock_result is not None
+            }
+            analysis = [
+                analysed[stock_param.symbol] for stock_param in stock_params
+                if stock_param.symbol in analysed
+            ]
 
             if analysis:
                 result = display_analysis(analysis)
@@ -239,15 +278,14 @@ def process_multi_stock() -> Union[bool, ControlCode]:
         return result
 
 
-def get_stock_symbols(index: int, num_stocks: int,
-                      stock_params: List[StockParam]):
+def get_stock_symbols(index: int, num_stocks: int, entered: Set[str]):
     """
     Enter a stock param for multi-stock analysis
 
     Args:
         index (int): index of multiple stocks. Defaults to None.
         num_stocks (int): number of multiple stocks. Defaults to None.
-        stock_params (List[StockParam]): list of stock params
+        entered (Set[str]): previously entered stock symbols
 
     Returns:
         StockParam: selected stock
@@ -270,10 +308,7 @@ def get_stock_symbols(index: int, num_stocks: int,
                 selection.symbol if isinstance(selection, Company)
                 else selection)
 
-        if list(filter(
-                    lambda entry: entry.symbol == selection.symbol,
-                    stock_params
-                )):
+        if selection.symbol in entered:
             error(f'{selection.symbol} already entered')
         else:
             result = selection
@@ -311,15 +346,9 @@ def process_stock(symbol: str = None) -> bool:
     if not ControlCode.is_end_code(stock_param):
         result = ControlCode.CONTINUE
 
-        data_frame = get_sheets_data(stock_param)
-
-        # check for gaps in data
-        data_frame = fill_gaps(data_frame, stock_param)
-
-        if data_frame is not None and not data_frame.empty:
-            display_analysis(
-                analyse_stock(data_frame, stock_param)
-            )
+        analysis = analyse_stock_data(stock_param)
+        if analysis is not None:
+            display_analysis(analysis)
 
     else:
         result = stock_param
@@ -327,9 +356,210 @@ def process_stock(symbol: str = None) -> bool:
     return result
 
 
+def analyse_stock_data(stock_param: StockParam) -> Union[dict, None]:
+    """
+    Load and analyse the data for a stock
+
+    Args:
+        stock_param (StockParam): params for stock
+
+    Returns:
+        Union[dict, None]: analysis result or None if no data
+    """
+    return _analyse_data(load_stock_data(stock_param), stock_param)
+
+
+def analyse_stocks_data(
+            stock_params: List[StockParam]
+        ) -> List[Union[dict, None]]:
+    """
+    Load and analyse the data for multiple stocks. Each stock is analysed
+    as soon as its data is loaded, overlapping the loading of the others,
+    and only the analysis results are retained, not the data frames.
+
+    Args:
+        stock_params (List[StockParam]): params for stocks
+
+    Returns:
+        List[Union[dict, None]]: analysis results in the same order as
+                                ``stock_params``, None if no data
+    """
+    analysis = [None] * len(stock_params)
+    for index, data_frame in load_stocks_data(stock_params):
+        analysis[index] = _analyse_data(data_frame, stock_params[index])
+    return analysis
+
+
+def _analyse_data(
+            data_frame: DataFrame, stock_param: StockParam
+        ) -> Union[dict, None]:
+    """
+    Analyse the data for a stock
+
+    Args:
+        data_frame (DataFrame): data to analyse
+        stock_param (StockParam): params for stock
+
+    Returns:
+        Union[dict, None]: analysis result or None if no data
+    """
+    return analyse_stock(data_frame, stock_param) \
+        if data_frame is not None and not data_frame.empty else None
+
+
+@ttl_lru_cache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+def _cached_company_search(
+            name: str, col: CompanyColumn
+        ) -> Union[Pagination, None]:
+    """
+    Search companies, caching the result
+
+    Args:
+        name (str): value or part of value to match
+        col (CompanyColumn): column to search
+
+    Returns:
+        Pagination: paginated results or None of not found
+    """
+    # page as the results menu does, so pages retrieved are shared by
+    # copies of the cached result
+    return search_company(name, col=col, page_size=Menu.DEFAULT_ROWS)
+
+
+def cached_company_search(
+            name: str, col: CompanyColumn
+        ) -> Union[Pagination, None]:
+    """
+    Search companies, using cached results if available
+
+    Args:
+        name (str): value or part of value to match
+        col (CompanyColumn): column to search
+
+    Returns:
+        Pagination: paginated results or None of not found
+    """
+    companies = _cached_company_search(name, col)
+    # results are paged by the caller, so return an independent copy
+    return companies.copy() if companies else companies
+
+
+def clear_data_caches():
+    """ Clear the cached search results """
+    _cached_company_search.cache_clear()
+
+
+def load_stock_data(stock_param: StockParam) -> DataFrame:
+    """
+    Load the data for a stock, downloading any missing data. Repeat
+    loads are served from the local cache, avoiding sheets requests.
+
+    Args:
+        stock_param (StockParam): params for stock
+
+    Returns:
+        DataFrame: data frame
+    """
+    data_frame = _local_stock_data(stock_param)
+    if data_frame is not None:
+        # fully cached locally, already checked for gaps
+        return data_frame
+
+    # not fully cached locally, so read from sheets
+    data_frame = get_sheets_data(stock_param)
+
+    # check for gaps in data
+    return fill_gaps(data_frame, stock_param)
+
+
+def load_stocks_data(
+            stock_params: List[StockParam]
+        ) -> Iterator[Tuple[int, DataFrame]]:
+    """
+    Load the data for multiple stocks, downloading any missing data.
+    Data not available locally is read from sheets in a single request,
+    and gaps are filled concurrently. Data frames are yielded as they
+    become available, so they may be processed while gaps in other data
+    are being filled.
+
+    Args:
+        stock_params (List[StockParam]): params for stocks
+
+    Returns:
+        Iterator[Tuple[int, DataFrame]]: index in ``stock_params`` and
+                                        data frame, in order of completion
+    """
+    to_read = []
+    for index, stock_param in enumerate(stock_params):
+        data_frame = _local_stock_data(stock_param)
+        if data_frame is not None:
+            # fully cached locally, already checked for gaps
+            yield index, data_frame
+        else:
+            to_read.append(index)
+
+    if not to_read:
+        return
+
+    sheets_data = get_sheets_data_bulk(
+        [stock_params[index] for index in to_read])
+
+    # check for gaps in data
+    with ThreadPoolExecutor(
+            max_workers=max_workers(len(to_read))) as executor:
+        futures = {
+            executor.submit(
+                _fill_gaps_or_existing,
+                sheets_data.get(stock_params[index].symbol),
+                stock_params[index]
+            ): index for index in to_read
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _fill_gaps_or_existing(
+            data_frame: DataFrame, stock_param: StockParam
+        ) -> DataFrame:
+    """
+    Fill gaps in a data frame, so a failure for one stock doesn't abort
+    the loading of the others
+
+    Args:
+        data_frame (DataFrame): data frame to process
+        stock_param (StockParam): params for stock
+
+    Returns:
+        DataFrame: data frame, or the existing data if gaps couldn't be
+                    filled
+    """
+    try:
+        data_frame = fill_gaps(data_frame, stock_param)
+    except Exception as exc:
+        error(f'Error loading {stock_param.symbol}: {exc}')
+    return data_frame
+
+
+def _local_stock_data(stock_param: StockParam) -> Union[DataFrame, None]:
+    """
+    Get the data for a stock from the local cache, if fully available
+
+    Args:
+        stock_param (StockParam): params for stock
+
+    Returns:
+        Union[DataFrame, None]: DataFrame if all data found otherwise None
+    """
+    data_frame = read_cached_stock_data(stock_param)
+    if data_frame is not None and check_partial(data_frame, stock_param):
+        data_frame = None
+    return data_frame
+
+
 def fill_gaps(data_frame: DataFrame, stock_param: StockParam) -> DataFrame:
     """
-    Fill gaps in a data frame
+    Fill gaps in a data frame, and cache the date ranges which are
+    completely covered by the resulting data
 
     Args:
         data_frame (DataFrame): data frame to process
@@ -341,22 +571,150 @@ def fill_gaps(data_frame: DataFrame, stock_param: StockParam) -> DataFrame:
     # check for gaps in data
     gaps = check_partial(data_frame, stock_param)
     if len(gaps) > 0:
-        full_frame = data_frame
-        for gap_param in gaps:
-            # save data to sheets
-            data = download_stock_data(gap_param)
-            if data.response_ok:
-                save_stock_data(data)
-
-                # add data to data frame
-                full_frame = concat([full_frame, data.data_frame]) \
-                    if full_frame is not None else data.data_frame
+        parts = [data_frame] if data_frame is not None else []
+
+        # download gaps concurrently, nearby gaps in a single request
+        groups = _group_gaps(gaps)
+        with ThreadPoolExecutor(
+                max_workers=max_workers(len(groups))) as executor:
+            results = [
+                data for group_downloads in executor.map(
+                    _download_gaps, groups)
+                for data in group_downloads
+            ]
+
+        downloads = [data for data in results if data.response_ok]
+        downloaded = [data.data_frame for data in downloads]
+        if downloaded:
+            # save all gaps to sheets in a single append
+            gap_frame = downloaded[0] if len(downloaded) == 1 \
+                else _stack_frames(downloaded)
+            # gaps for multiple stocks may be filled concurrently, so
+            # serialise the sheet check/create & append operations
+            with _SAVE_LOCK:
+                save_stock_data(gap_frame, stock_param)
+
+            # add data to data frame
+            parts.append(gap_frame)
+
+        if len(parts) > 1:
+            # combine once to avoid copying the frame for each gap
+            date_col = DfColumn.DATE.title
+            full_frame = _stack_frames(parts).drop_duplicates(
+                subset=date_col, keep='last'
+            ).sort_values(by=date_col, ignore_index=True)
+        else:
+            full_frame = parts[0] if parts else None
+
+        if len(downloads) == len(results):
+            # all gaps filled, so the whole range is covered
+            cache_stock_data(stock_param, full_frame)
+        elif downloads:
+            # only the downloaded gaps are known to be covered
+            cache_stock_data(
+                [data.stock_param for data in downloads], gap_frame)
     else:
         full_frame = data_frame
+        cache_stock_data(stock_param, full_frame)
 
     return full_frame
 
 
+def _stack_frames(parts: List[DataFrame]) -> DataFrame:
+    """
+    Stack data frames with the same columns, column by column, avoiding
+    the block consolidation and index reconciliation of concat
+
+    Args:
+        parts (List[DataFrame]): data frames to stack
+
+    Returns:
+        DataFrame: stacked data frame
+    """
+    date_col = DfColumn.DATE.title
+    columns = list(parts[0].columns)
+    # column order may differ between sheet and downloaded data, only a
+    # different set of columns requires the generic path
+    if any(set(part.columns) != set(columns) for part in parts[1:]):
+        stacked = concat(parts, copy=False, sort=False, ignore_index=True)
+        stacked[date_col] = to_datetime(stacked[date_col])
+        return stacked
+
+    return DataFrame({
+        # sheet data dates are dates and downloaded data are timestamps,
+        # align so overlapping rows may be removed
+        column: np.concatenate([
+            to_datetime(part[column]).to_numpy() if column == date_col
+            else part[column].to_numpy()
+            for part in parts
+        ]) for column in columns
+    })
+
+
+def _group_gaps(gaps: List[StockParam]) -> List[List[StockParam]]:
+    """
+    Group gaps in stock data which may be downloaded in a single request.
+    Consecutive gaps are grouped while at least half of the combined date
+    range is missing data.
+
+    Args:
+        gaps (List[StockParam]): params for gaps, in date order
+
+    Returns:
+        List[List[StockParam]]: grouped gaps
+    """
+    groups = []
+    missing = 0
+    for gap in gaps:
+        gap_days = (gap.to_date - gap.from_date).days
+        if groups and \
+                (gap.to_date - groups[-1][0].from_date).days <= \
+                2 * (missing + gap_days):
+            groups[-1].append(gap)
+            missing += gap_days
+        else:
+            groups.append([gap])
+            missing = gap_days
+    return groups
+
+
+def _download_gaps(gap_params: List[StockParam]) -> List[StockDownload]:
+    """
+    Download the data for a group of gaps in stock data in a single
+    request, and split the result by gap
+
+    Args:
+        gap_params (List[StockParam]): params for gaps, in date order
+
+    Returns:
+        List[StockDownload]: download result for each gap, or the failed
+                            download result
+    """
+    if len(gap_params) == 1:
+        return [download_stock_data(gap_params[0])]
+
+    download = download_stock_data(
+        StockParam.stock_param_of(
+            gap_params[0].symbol, gap_params[0].from_date,
+            gap_params[-1].to_date)
+    )
+    if not download.response_ok:
+        return [download]
+
+    data_frame = download.data_frame
+    dates = data_frame[DfColumn.DATE.title]
+    return [
+        StockDownload(
+            gap_param,
+            data_frame[
+                (dates >= Timestamp(gap_param.from_date)) &
+                (dates < Timestamp(gap_param.to_date))
+            ].reset_index(drop=True),
+            download.status_code
+        ) for gap_param in gap_params
+    ]
+
+
 class CompanyAction(Enum):
     """ Enum representing actions to on company selection """
     PROCESS = auto()
@@ -381,25 +739,34 @@ def stock_selected_func(
     Returns:
         Callable[[], bool]: process function
     """
+    return partial(process_stock, company.symbol) \
+        if action == CompanyAction.PROCESS and not secondary else \
+        partial(_process_selected, company, action, secondary)
 
-    def process_func() -> bool:
-        """
-        Process a stock analysis
 
-        Returns:
-            bool: True if processed, otherwise False
-        """
-        if action == CompanyAction.PROCESS:
-            # process company and continue search
-            result = process_stock(company.symbol)
-        else:
-            # return company and end search
-            result = company
-        if secondary:
-            secondary()
-        return result
+def _process_selected(
+        company: Company, action: CompanyAction,
+        secondary: Union[Callable[[], None], None]) -> Any:
+    """
+    Process a selected company
 
-    return process_func
+    Args:
+        company (Company): company to process
+        action (CompanyAction): action to perform on selection
+        secondary (Union[Callable[[], None], None]): secondary processing
+
+    Returns:
+        Any: processing result if action is PROCESS, otherwise company
+    """
+    if action == CompanyAction.PROCESS:
+        # process company and continue search
+        result = process_stock(company.symbol)
+    else:
+        # return company and end search
+        result = company
+    if secondary:
+        secondary()
+    return result
 
 
 def process_exchanges():
@@ -440,11 +807,12 @@ def process_exchanges():
             lambda: download_exchanges(data_mode=data_mode))
 
         if exchanges.response_ok:
-            exchanges = save_exchanges(exchanges) \
-                if exchanges.response_ok else None
-
-            for i, exchange in enumerate(exchanges):
+            exchanges = save_exchanges(exchanges)
 
+            # confirm exchanges to process up front, so downloads may run
+            # concurrently while the results are saved
+            codes = []
+            for exchange in exchanges:
                 code = exchange['exchangeCode']
 
                 if choices['confirm_each']:
@@ -454,23 +822,77 @@ def process_exchanges():
                     elif user_input == ControlCode.NOT_CONFIRMED:
                         continue
 
-                info(f"{i + 1}/{len(exchanges)}: Processing {code}")
+                codes.append(code)
+
+            end_input = user_input if user_input.is_end_code() else None
+
+            user_input = download_exchange_companies(
+                codes, choices, data_mode=data_mode)
+            _cached_company_search.cache_clear()
+            if end_input is not None:
+                user_input = end_input
+
+    return user_input
+
+
+def download_exchange_companies(
+            codes: List[str], choices: dict, data_mode: DataMode
+        ) -> ControlCode:
+    """
+    Download and save the companies for the specified exchanges.
+    Downloads are performed concurrently, while saving is performed
+    sequentially as each download completes.
 
+    Args:
+        codes (List[str]): exchange codes
+        choices (dict): user choices
+        data_mode (DataMode): data mode
+
+    Returns:
+        ControlCode: user input
+    """
+    user_input = ControlCode.CONTINUE
+    if not codes:
+        return user_input
+
+    total = len(codes)
+    with ThreadPoolExecutor(max_workers=max_workers(total)) as executor:
+        futures = {
+            executor.submit(
+                download_companies, code, data_mode=data_mode): code
+            for code in codes
+        }
+        for i, future in enumerate(as_completed(futures)):
+            code = futures[future]
+
+            info(f"{i + 1}/{total}: Processing {code}")
+
+            try:
+                companies_data = future.result()
+            except Exception as exc:
+                # don't let one exchange abort the others
+                error(f'Error downloading {code}: {exc}')
+                continue
+
+            if companies_data.status_code == StockDownload.NO_RESPONSE:
+                # retry on main thread as user confirmation required
                 companies_data, user_input = download_data(
-                    lambda: download_companies(code, data_mode=data_mode))
+                    partial(download_companies, code, data_mode=data_mode))
 
-                if user_input.is_unconfirmed():
-                    break
+            if user_input.is_unconfirmed():
+                for pending in futures:
+                    pending.cancel()
+                break
 
-                if companies_data.response_ok:
+            if companies_data.response_ok:
 
-                    companies_list = save_companies(
-                        companies_data, clear_sheet=choices['clear_sheet'])
-                    choices['clear_sheet'] = False
+                companies_list = save_companies(
+                    companies_data, clear_sheet=choices['clear_sheet'])
+                choices['clear_sheet'] = False
 
-                    if choices['save_sample'] and companies_list:
-                        save_json_file(
-                            sample_exchange_path(code), companies_list)
+                if choices['save_sample'] and companies_list:
+                    save_json_file(
+                        sample_exchange_path(code), companies_list)
 
     return user_input
 
@@ -489,11 +911,17 @@ def download_data(
     """
     response = None
     user_input = ControlCode.CONTINUE
+    attempt = 0
     while response is None:
         response = download_func()
         if response.status_code == StockDownload.NO_RESPONSE:
             user_input = user_confirm("Please confirm it is ok to retry")
             if user_input == ControlCode.CONFIRMED:
+                # back off before retrying, so repeated retries don't
+                # hammer the server
+                attempt += 1
+                sleep(min(0.5 * 2 ** attempt + uniform(0, 0.5),
+                          MAX_RETRY_DELAY))
                 response = None
                 continue
             if user_input.is_end_code():
@@ -518,25 +946,29 @@ def company_name_search(action: CompanyAction = CompanyAction.PROCESS) -> Any:
     MenuElement = CloseMenuEntry \
         if action == CompanyAction.RETURN else MenuEntry
 
-    def generate_selected_func(company: Company) -> Callable[[], Any]:
-        return stock_selected_func(
-            company, action,
-            secondary=lambda: ControlCode.CONTINUE
-            if action == CompanyAction.RETURN else None
-        )
+    generate_selected_func = partial(stock_selected_func, action=action)
 
+    rows = Menu.DEFAULT_ROWS
+    last_name = None
+    last_menu = None
     while result is None:
         title('Company Name Search')
 
         name = get_input(
             'Enter company name',
+            validate=normalise_search,
             help_text=COMPANY_SEARCH_HELP
         )
         if ControlCode.is_end_code(name):
             result = name
             break
 
-        companies = search_company(name, col=CompanyColumn.NAME)
+        if name == last_name:
+            # same search again, reuse previous results menu
+            result = process_search_menu(last_menu)
+            continue
+
+        companies = cached_company_search(name, CompanyColumn.NAME)
 
         if not companies:
             query = '. Are you searching by company name?' \
@@ -547,17 +979,17 @@ def company_name_search(action: CompanyAction = CompanyAction.PROCESS) -> Any:
         info(f'{companies.num_items} matching results found')
 
         # Note: menu & pagination page sizes must match
-        companies.set_page_size(Menu.DEFAULT_ROWS)
+        companies.set_page_size(rows)
 
         # populate first page
         menu_items = company_menu_items(
             companies.get_current_page(), generate_selected_func, MenuElement)
         if companies.num_pages > 1:
-            # add placeholders for other pages
-            menu_items.extend([
-                ProxyMenuEntry()
-                for _ in range(Menu.DEFAULT_ROWS, len(companies.items))
-            ])
+            # add placeholders for other pages, entries are generated
+            # when page visited
+            menu_items.extend(
+                [_PROXY_SENTINEL] * (companies.num_items - rows)
+            )
         # add last items
         menu_items.extend([
             CloseMenuEntry('Search again', lambda: ControlCode.BACK,
@@ -565,42 +997,86 @@ def company_name_search(action: CompanyAction = CompanyAction.PROCESS) -> Any:
             CloseMenuEntry('End search', lambda: ControlCode.HOME),
         ])
 
-        def up_down_hook(menu: Menu, start: int, end: int) -> None:
+        def up_down_hook(menu: Menu, start: int, end: int,
+                         companies: Pagination = companies,
+                         rows: int = rows,
+                         selected_func: Callable = generate_selected_func,
+                         menu_element: Type = MenuElement) -> None:
             """
             Handle menu page up/down
             :param menu: menu
             :param start: start display index
             :param end: end display index
+            :param companies: search results; bound at definition as the
+                              menu may be reused after subsequent searches
+            :param rows: page size
+            :param selected_func: call function generator for selection
+            :param menu_element: menu entry type
             """
-            if not menu.entries[start] or menu.entries[start].is_proxy:
+            entry = menu.entries[start]
+            if not entry or entry.is_proxy:
                 # populate page with menu items
-                items = companies.get_page(int(start / Menu.DEFAULT_ROWS) + 1)
+                items = companies.get_page(start // rows + 1)
 
                 item_cnt = len(items)
-                if end == menu.num_entries:
+                num_entries = menu.num_entries
+                if end == num_entries:
                     item_cnt += 2   # search and end search entries
-                elif end == menu.num_entries - 1:
+                elif end == num_entries - 1:
                     item_cnt += 1   # end search entries
 
                 assert item_cnt == end - start,\
                     f'Page size mismatch: {item_cnt} != {end} - {start}'
 
                 menu.entries[start:start + len(items)] = \
-                    company_menu_items(
-                        items, generate_selected_func, MenuElement)
+                    company_menu_items(items, selected_func, menu_element)
 
         company_menu: Menu = Menu(menu_title='Company Search Results')
         company_menu.set_entries(menu_items)
         company_menu.set_up_down_hook(up_down_hook)
 
-        result = company_menu.process()
-        if result == ControlCode.BACK:
-            # back from sub level, get search name again
-            result = None
+        last_name = name
+        last_menu = company_menu
+
+        result = process_search_menu(company_menu)
 
     return result
 
 
+def process_search_menu(company_menu: Menu) -> Any:
+    """
+    Process a company search results menu
+
+    Args:
+        company_menu (Menu): menu to process
+
+    Returns:
+        Any: Result of selected option's call function or None to search
+            again
+    """
+    result = company_menu.process()
+    if result == ControlCode.BACK:
+        # back from sub level, get search name again
+        result = None
+    return result
+
+
+def normalise_search(text: str) -> Union[str, None]:
+    """
+    Normalise search text, so equivalent searches share cached results
+
+    Args:
+        text (str): search text
+
+    Returns:
+        Union[str, None]: normalised text or None if invalid
+    """
+    text = ' '.join(text.split()).lower()
+    if not text:
+        error('Input required')
+    return text if text else None
+
+
 def company_menu_items(
         companies: List[Company],
         selected_func: Callable[[Company], Any],
@@ -620,7 +1096,7 @@ def company_menu_items(
     """
     return [
         menu_element(
-            f'{company.name} [{company.symbol}]',
+            company.label,
             selected_func(company)
         ) for company in companies
     ]
@@ -634,3 +1110,5 @@ def delete_stock_data():
                               f"Please confirm it is ok to proceed")
     if user_input == ControlCode.CONFIRMED:
         del_stock_sheets()
+        clear_data_caches()
+        clear_cache()
@@ -0,0 +1,221 @@
+"""
+Local data cache related functions
+"""
+import os
+import sqlite3
+from datetime import date, datetime
+from threading import Lock
+from typing import List, Union
+
+import pandas as pd
+
+from stock import StockParam, DfColumn
+from utils import cache_path, cache_ttl
+
+STOCK_TABLE = 'stock_bars'
+""" Stock data table name """
+SYMBOL_COLUMN = 'Symbol'
+""" Symbol column name """
+CACHED_COLUMN = 'Cached'
+""" Time cached column name """
+RANGE_TABLE = 'cached_ranges'
+"""
+Cached date ranges table name; stock data is only read from the cache for
+date ranges which were completely cached
+"""
+FROM_COLUMN = 'FromDate'
+""" Range from date (inclusive) column name """
+TO_COLUMN = 'ToDate'
+""" Range to date (exclusive) column name """
+
+_CONNECTION = None
+_LOCK = Lock()
+
+
+def cache_connection() -> sqlite3.Connection:
+    """
+    Get the cache database connection
+
+    Returns:
+        sqlite3.Connection: connection
+    """
+    global _CONNECTION
+    if _CONNECTION is None:
+        path = cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # connection is shared by worker threads, access is serialised
+        _CONNECTION = sqlite3.connect(path, check_same_thread=False)
+        _CONNECTION.execute('PRAGMA journal_mode=WAL')
+        _CONNECTION.execute('PRAGMA synchronous=NORMAL')
+
+        columns = ', '.join(
+            f'{column.title} TEXT' if column == DfColumn.DATE else
+            f'{column.title} INTEGER' if column == DfColumn.VOLUME else
+            f'{column.title} REAL'
+            for column in DfColumn
+        )
+        _CONNECTION.execute(
+            f'CREATE TABLE IF NOT EXISTS {STOCK_TABLE} '
+            f'({SYMBOL_COLUMN} TEXT, {columns}, {CACHED_COLUMN} TEXT, '
+            f'PRIMARY KEY ({SYMBOL_COLUMN}, {DfColumn.DATE.title}))'
+        )
+        _CONNECTION.execute(
+            f'CREATE TABLE IF NOT EXISTS {RANGE_TABLE} '
+            f'({SYMBOL_COLUMN} TEXT, {FROM_COLUMN} TEXT, {TO_COLUMN} TEXT, '
+            f'{CACHED_COLUMN} TEXT)'
+        )
+        existing = [
+            row[1] for row in
+            _CONNECTION.execute(f'PRAGMA table_info({STOCK_TABLE})')
+        ]
+        if CACHED_COLUMN not in existing:
+            # cache created before time to live added, treat as expired
+            _CONNECTION.execute(
+                f'ALTER TABLE {STOCK_TABLE} '
+                f"ADD COLUMN {CACHED_COLUMN} TEXT DEFAULT ''"
+            )
+        _CONNECTION.commit()
+    return _CONNECTION
+
+
+def read_cached_stock_data(
+            stock_param: StockParam
+        ) -> Union[pd.DataFrame, None]:
+    """
+    Read stock data from the cache, ignoring data older than the cache
+    time to live. Data is only returned if the requested date range was
+    completely cached.
+
+    Args:
+        stock_param (StockParam): stock parameters
+
+    Returns:
+        Union[pd.DataFrame, None]: DataFrame if data found otherwise None
+    """
+    cutoff = (datetime.now() - cache_ttl()).isoformat()
+    with _LOCK:
+        connection = cache_connection()
+        if not _is_cached_range(connection, stock_param, cutoff):
+            return None
+
+        data_frame = pd.read_sql_query(
+            f'SELECT {", ".join(DfColumn.titles())} FROM {STOCK_TABLE} '
+            f'WHERE {SYMBOL_COLUMN} = ? AND {DfColumn.DATE.title} >= ? '
+            f'AND {DfColumn.DATE.title} < ? AND {CACHED_COLUMN} >= ? '
+            f'ORDER BY {DfColumn.DATE.title}',
+            connection,
+            params=(
+                stock_param.symbol, stock_param.from_date.isoformat(),
+                stock_param.to_date.isoformat(), cutoff
+            )
+        )
+
+    if data_frame.empty:
+        return None
+
+    # same form as data read from sheets
+    data_frame[DfColumn.DATE.title] = \
+        pd.to_datetime(data_frame[DfColumn.DATE.title]).dt.date
+    return data_frame
+
+
+def _is_cached_range(
+        connection: sqlite3.Connection, stock_param: StockParam,
+        cutoff: str) -> bool:
+    """
+    Check if the date range of stock parameters is covered by unexpired
+    cached date ranges
+
+    Args:
+        connection (sqlite3.Connection): cache database connection
+        stock_param (StockParam): stock parameters
+        cutoff (str): ISO format time before which cached data is expired
+
+    Returns:
+        bool: True if the date range is cached, otherwise False
+    """
+    ranges = connection.execute(
+        f'SELECT {FROM_COLUMN}, {TO_COLUMN} FROM {RANGE_TABLE} '
+        f'WHERE {SYMBOL_COLUMN} = ? AND {FROM_COLUMN} < ? '
+        f'AND {TO_COLUMN} > ? AND {CACHED_COLUMN} >= ? '
+        f'ORDER BY {FROM_COLUMN}',
+        (
+            stock_param.symbol, stock_param.to_date.isoformat(),
+            stock_param.from_date.isoformat(), cutoff
+        )
+    )
+    # ranges are in from date order, so covered while each range starts
+    # before the end of the range covered so far
+    covered_to = stock_param.from_date.isoformat()
+    for from_iso, to_iso in ranges:
+        if from_iso > covered_to:
+            break
+        covered_to = max(covered_to, to_iso)
+    return covered_to >= stock_param.to_date.isoformat()
+
+
+def cache_stock_data(
+        stock_params: Union[StockParam, List[StockParam]],
+        data_frame: pd.DataFrame):
+    """
+    Save stock data to the cache. Data for the current day is not saved,
+    as it may be incomplete.
+
+    Args:
+        stock_params (Union[StockParam, List[StockParam]]): parameters
+                of the date range(s) completely covered by the data
+        data_frame (pd.DataFrame): data to save
+    """
+    if data_frame is None or data_frame.empty:
+        return
+
+    if isinstance(stock_params, StockParam):
+        stock_params = [stock_params]
+
+    # the current day's data may be incomplete, so only cache closed days
+    today = date.today()
+    dates = pd.to_datetime(data_frame[DfColumn.DATE.title])
+    closed = dates < pd.Timestamp(today)
+    if not closed.any():
+        return
+
+    symbol = stock_params[0].symbol
+    cached = datetime.now().isoformat()
+
+    records = data_frame.loc[closed, DfColumn.titles()].copy()
+    records[DfColumn.DATE.title] = dates[closed].dt.strftime('%Y-%m-%d')
+    records.insert(0, SYMBOL_COLUMN, symbol)
+    records[CACHED_COLUMN] = cached
+
+    ranges = [
+        (symbol, param.from_date.isoformat(),
+         min(param.to_date, today).isoformat(), cached)
+        for param in stock_params if param.from_date < today
+    ]
+
+    placeholders = ', '.join(['?'] * len(records.columns))
+    with _LOCK:
+        connection = cache_connection()
+        connection.executemany(
+            f'INSERT OR REPLACE INTO {STOCK_TABLE} '
+            f'VALUES ({placeholders})',
+            records.itertuples(index=False, name=None)
+        )
+        # discard expired ranges, so the table doesn't grow indefinitely
+        connection.execute(
+            f'DELETE FROM {RANGE_TABLE} WHERE {CACHED_COLUMN} < ?',
+            ((datetime.now() - cache_ttl()).isoformat(),)
+        )
+        connection.executemany(
+            f'INSERT INTO {RANGE_TABLE} VALUES (?, ?, ?, ?)', ranges)
+        connection.commit()
+
+
+def clear_cache():
+    """ Clear all cached data """
+    with _LOCK:
+        connection = cache_connection()
+        connection.execute(f'DELETE FROM {STOCK_TABLE}')
+        connection.execute(f'DELETE FROM {RANGE_TABLE}')
+        connection.commit()
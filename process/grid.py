@@ -4,8 +4,9 @@ Grid display functions
 
 from dataclasses import dataclass
 from enum import Enum, unique
+from functools import lru_cache
 from typing import List, Tuple, Union
-from utils import Colour, colorise, scrn_print
+from utils import Colour, colour_wrap, scrn_print
 
 # markers for highlight layout when debugging
 _DEBUG = False
@@ -32,6 +33,7 @@ class Marker(Enum):
         self._m_string = m_string
         self._colour = colour
         self._on_colour = on_colour
+        self._wrap = None
 
     @property
     def colour(self):
@@ -53,6 +55,19 @@ class Marker(Enum):
         """
         return self._on_colour
 
+    @property
+    def wrap(self) -> Tuple[str, str]:
+        """
+        Marker colour control chars, generated on first use as the colour
+        environment settings may not be loaded when markers are created
+
+        Returns:
+            Tuple[str, str]: tuple of prefix and suffix control chars
+        """
+        if self._wrap is None:
+            self._wrap = colour_wrap(self._colour, self._on_colour)
+        return self._wrap
+
     @property
     def m_string(self):
         """
@@ -80,52 +95,67 @@ class Str():
         self.length = length
         self.ctrl_len = len(self.text) - self.length
 
-    @staticmethod
-    def unpack(text: Union[str, object] = None) -> Tuple:
-        """
-        Unpack a Str object or str
 
-        Args:
-            text (Union[str, Str], optional): object or if not specified self
+def padding(
+        left_margin: int, right_margin: int, gap: int) -> Tuple[str, str, str]:
+    """
+    Generate the padding strings for cells
+
+    Args:
+        left_margin (int): left cell margin
+        right_margin (int): right cell margin
+        gap (int): inter-cell gap
+
+    Returns:
+        Tuple[str, str, str]: tuple of left margin, right margin and gap
+                              padding
+    """
+    return ''.rjust(left_margin), ''.rjust(right_margin), \
+        ''.rjust(gap, GAP_CHAR)
 
-        Returns:
-            Tuple: tuple(
-                bool: is Str object flag,
-                str: display string
-                length: display length
-                ctrl_len: length of ctrl chars in string
-            )
-        """
-        is_str = isinstance(text, Str)
-        return \
-            is_str, \
-            text.text if is_str else text, \
-            text.length if is_str else len(text), \
-            text.ctrl_len if is_str else 0
+
+@lru_cache(maxsize=128)
+def resolve_fmt(fmt: str, width: int, ctrl_len: int) -> Tuple[str, bool]:
+    """
+    Resolve a format specification; the combinations of format, width and
+    ctrl char length used by a grid are few, so the results are cached
+
+    Args:
+        fmt (str): format specification
+        width (int): width
+        ctrl_len (int): length of ctrl chars in text to format
+
+    Returns:
+        Tuple[str, bool]: tuple of format specification and required
+                          width flag
+    """
+    req_width = FORMAT_WIDTH_MARK in fmt
+    # add incoming ctrl char len to required width
+    fmt_str = fmt.replace(FORMAT_WIDTH_MARK, str(width + ctrl_len)) \
+        if req_width and width else fmt
+    return fmt_str, req_width
 
 
 class FormatMixin:
     """ Mixin class supplying formatting functions """
 
-    def format_str(self, text: Union[str, Str], fmt: str = None,
+    def format_str(self, text: Str, fmt: str = None,
                    width: int = None) -> Str:
         """
         Format a string of text
 
         Args:
-            text (Union[str, Str]): text to format
+            text (Str): text to format
             fmt (str, optional): Format specification. Defaults to None.
             width (int, optional): width. Defaults to None.
 
         Returns:
             Str: formatted text
         """
-        _, formatted, _, ctrl_len = Str.unpack(text)
+        formatted = text.text
+        ctrl_len = text.ctrl_len
         if fmt:
-            req_width = fmt.find(FORMAT_WIDTH_MARK) >= 0
-            # add incoming ctrl char len to required width
-            fmt_str = fmt.replace(FORMAT_WIDTH_MARK, str(width + ctrl_len)) \
-                if width else fmt
+            fmt_str, req_width = resolve_fmt(fmt, width, ctrl_len)
             formatted = f'{formatted:{fmt_str}}'
         else:
             req_width = False
@@ -134,13 +164,13 @@ class FormatMixin:
         return Str(f'{formatted}{EOL}',
                    len(formatted) - (ctrl_len if req_width else 0))
 
-    def colorised_str(self, text: Union[str, Str], fmt: str = None,
+    def colorised_str(self, text: Str, fmt: str = None,
                       width: int = None, marker: Marker = None) -> Str:
         """
         Format and colourise a string of text
 
         Args:
-            text (Union[str, Str]): text to format
+            text (Str): text to format
             fmt (str, optional): Format specification. Defaults to None.
             width (int, optional): width. Defaults to None.
             marker (Marker, optional): marker with colour information.
@@ -151,12 +181,8 @@ class FormatMixin:
         """
         formed_str = self.format_str(text, fmt=fmt, width=width)
 
-        colours = {}
-        if marker:
-            colours['colour'] = marker.colour if marker.colour else None
-            colours['on_colour'] = marker.on_colour \
-                if marker.on_colour else None
-        formed_str.text = colorise(formed_str.text, **colours)
+        prefix, suffix = marker.wrap if marker else colour_wrap()
+        formed_str.text = f'{prefix}{formed_str.text}{suffix}'
         formed_str.ctrl_len = len(formed_str.text) - formed_str.length
         return formed_str
 
@@ -215,8 +241,9 @@ class DCell(FormatMixin):
     fmt: str
     """ Format specification """
 
-    def __init__(self, text: str, width: int, fmt: str = None):
-        self.text = text
+    def __init__(self, text: Union[str, Str], width: int, fmt: str = None):
+        # text is held as a Str, so formatting doesn't need to check its type
+        self.text = text if isinstance(text, Str) else Str(text, len(text))
         self.width = width
         self.x_pos = None
         self.marker = None
@@ -337,41 +364,40 @@ class DRow(FormatMixin):
             cell = [cell]
         self.cells.extend(cell)
 
-    def _formatted(
-            self, left_margin: int, right_margin: int, gap: int,
+    def format_with(
+            self, l_str: str, r_str: str, g_str: str,
             colourised: bool) -> str:
         """
-        Generate the formatted row text
+        Generate the formatted row text using padding strings, as
+        generated by ``padding()``
 
         Args:
-            left_margin (int): left cell margin
-            right_margin (int): right cell margin
-            gap (int): inter-cell gap; combines with left and right
-                       margin to created space between columns
+            l_str (str): left cell margin padding
+            r_str (str): right cell margin padding
+            g_str (str): inter-cell gap padding; combines with left and
+                        right margin to created space between columns
             colourised (bool): generate colourised string flag
 
         Returns:
             str: string to display
         """
-        line = ''
-        l_str = ''.rjust(left_margin)
-        r_str = ''.rjust(right_margin)
-        g_str = ''.rjust(gap, GAP_CHAR)
+        parts = []
+        gap_l_str = f'{g_str}{l_str}'
 
         length = 0  # length excluding ctrl chars
 
         for idx, cell in enumerate(self.cells):
-            add_gap = idx and idx < len(self.cells)
-
             formed_str = cell.colorised() if colourised else cell.formatted()
-            cell_text = f'{g_str if add_gap else ""}{l_str}' \
+            # gap before all but the first cell
+            cell_text = f'{gap_l_str if idx else l_str}' \
                         f'{formed_str.text}{r_str}'
 
             length += len(cell_text) - formed_str.ctrl_len
 
-            line = f'{line}{cell_text}'
+            parts.append(cell_text)
 
-        formed_line = Str(line, length)
+        # join once rather than building the line cell by cell
+        formed_line = Str(''.join(parts), length)
 
         formed_row = self.colorised_str(
             formed_line, self.fmt, self.width, self.marker) \
@@ -395,7 +421,8 @@ class DRow(FormatMixin):
         Returns:
             Str: string to display tuple
         """
-        return self._formatted(left_margin, right_margin, gap, False)
+        return self.format_with(
+            *padding(left_margin, right_margin, gap), False)
 
     def colorised(
             self, left_margin: int = 0, right_margin: int = 0,
@@ -412,7 +439,8 @@ class DRow(FormatMixin):
         Returns:
             Str: string to display tuple
         """
-        return self._formatted(left_margin, right_margin, gap, True)
+        return self.format_with(
+            *padding(left_margin, right_margin, gap), True)
 
     @classmethod
     def blank_row(cls, width: int = 1) -> object:
@@ -486,19 +514,12 @@ class DGrid(FormatMixin):
         Returns:
             str: string to display
         """
-        line = ''
-        params = {
-            'left_margin': left_margin,
-            'right_margin': right_margin,
-            'gap': gap
-        }
-
-        for idx, row in enumerate(self.rows):
-            generator = row.colorised if colourised else row.formatted
-            # no backslash allow in f-string, use chr(0x0A) for '\n'
-            line = f'{line}{chr(0x0A) if idx > 0 else ""}{generator(**params)}'
+        # padding is the same for all rows, so generate it once
+        pad_strs = padding(left_margin, right_margin, gap)
 
-        return line
+        return '\n'.join(
+            row.format_with(*pad_strs, colourised) for row in self.rows
+        )
 
     def display(self, colourised: bool = True):
         """
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Callable, Union
 
 from stock import StockParam, AnalysisRange, get_stock_param_range
@@ -125,6 +126,7 @@ def validate_symbol(symbol: str) -> Union[str, None]:
     return symbol
 
 
+@lru_cache(maxsize=64)
 def multi_stock_marker(index: int = None, num_stocks: int = None) -> str:
     """
     Get a multi-stock marker
@@ -136,4 +138,5 @@ def multi_stock_marker(index: int = None, num_stocks: int = None) -> str:
     Returns:
         str: marker
     """
-    return f' [{index + 1}/{num_stocks}]' if num_stocks > 1 else ''
+    return f' [{index + 1}/{num_stocks}]' \
+        if num_stocks is not None and num_stocks > 1 else ''
@@ -6,7 +6,7 @@ from colorama import init
 
 from utils import (
     Menu, CloseMenuEntry, MenuEntry, MenuOption, info, scrn_print,
-    MAX_SCREEN_HEIGHT
+    MAX_SCREEN_HEIGHT, close_http_session
 )
 from process import (
     process_exchanges, company_name_search, process_multi_stock, display_help,
@@ -36,11 +36,9 @@ def run_app():
 
     scrn_print('\n'*MAX_SCREEN_HEIGHT)
 
-    loop: bool = True
-    while loop:
-        menu.process()
+    menu.run_until_closed()
 
-        loop = menu.is_open
+    close_http_session()
 
     info('Bye')
 
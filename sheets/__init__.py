@@ -5,8 +5,10 @@ from .load_sheet import open_spreadsheet, sheet_exists, add_sheet
 from .save_sheet import (
     save_stock_data, save_exchanges, save_companies, save_stock_meta_data
 )
-from .find_info import find, find_all, read_data_by_date
-from .load_data import get_sheets_data, check_partial
+from .find_info import (
+    find, find_all, read_data_by_date, values_to_data_frame
+)
+from .load_data import get_sheets_data, get_sheets_data_bulk, check_partial
 from .search import (
     search_company, search_eft, search_mutual, search_future, search_index,
     search_all, search_meta
@@ -26,8 +28,10 @@ __all__ = [
     'find',
     'find_all',
     'read_data_by_date',
+    'values_to_data_frame',
 
     'get_sheets_data',
+    'get_sheets_data_bulk',
     'check_partial',
 
     'search_company',
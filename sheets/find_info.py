@@ -86,6 +86,29 @@ def read_data_by_date(
         max_date (Union[datetime, date]): max date (exclusive)
         sorted_asc (bool): sorted in ascending order flag; default True
 
+    Returns:
+        panda.DataFrame: data frame of data
+    """
+    return values_to_data_frame(
+        sheet_get_values(sheet), min_date, max_date, sorted_asc=sorted_asc)
+
+
+def values_to_data_frame(
+        values: List[List[str]],
+        min_date: Union[datetime, date],
+        max_date: Union[datetime, date],
+        sorted_asc: bool = True
+) -> pd.DataFrame:
+    """
+    Convert sheet values to a data frame of data within the specified
+    date limits
+
+    Args:
+        values (List[List[str]]): sheet values
+        min_date (Union[datetime, date]): min date (inclusive)
+        max_date (Union[datetime, date]): max date (exclusive)
+        sorted_asc (bool): sorted in ascending order flag; default True
+
     Returns:
         panda.DataFrame: data frame of data
     """
@@ -100,7 +123,7 @@ def read_data_by_date(
         # TODO more performant option that sheet.get_values?
         {
             title: line[col] for col, title in enumerate(DfColumn.titles())
-        } for line in sheet_get_values(sheet)
+        } for line in values
     ]
     data_frame = pd.DataFrame(list_of_dicts, columns=DfColumn.titles())
 
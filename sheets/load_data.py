@@ -2,13 +2,14 @@
 Google Sheets data load related functions
 """
 
-from datetime import date
-from typing import List, Union
+from typing import Dict, List, Union
+from gspread.utils import absolute_range_name
+import numpy as np
 import pandas as pd
 from stock import StockParam, DfColumn
-from utils import filter_data_frame_by_date
-from .load_sheet import sheet_exists
-from .find_info import read_data_by_date
+from .load_sheet import sheet_exists, init_spreadsheet
+from .find_info import read_data_by_date, values_to_data_frame
+from .spread_ops import spreadsheet_worksheets, spreadsheet_values_batch_get
 
 
 def get_sheets_data(stock_param: StockParam) -> Union[pd.DataFrame, None]:
@@ -36,6 +37,47 @@ def get_sheets_data(stock_param: StockParam) -> Union[pd.DataFrame, None]:
     return data
 
 
+def get_sheets_data_bulk(
+            stock_params: List[StockParam]
+        ) -> Dict[str, pd.DataFrame]:
+    """
+    Get data for multiple stocks from sheets, with a single read request
+
+    Args:
+        stock_params (List[StockParam]): stock parameters
+
+    Returns:
+        Dict[str, pd.DataFrame]: map of symbol to DataFrame for stocks
+                                with data found
+    """
+    data = {}
+
+    spreadsheet = init_spreadsheet()
+    if spreadsheet:
+        titles = {
+            sheet.title for sheet in spreadsheet_worksheets(spreadsheet)
+        }
+        params = [param for param in stock_params if param.symbol in titles]
+        if params:
+            result = spreadsheet_values_batch_get(
+                spreadsheet,
+                [absolute_range_name(param.symbol) for param in params]
+            )
+            # value ranges are returned in the order requested
+            for param, value_range in zip(params, result['valueRanges']):
+                values = value_range.get('values')
+                if not values:
+                    # empty sheet, treat as no data
+                    continue
+                data_frame = values_to_data_frame(
+                    values, param.from_date, param.to_date
+                )
+                if data_frame.size > 0:
+                    data[param.symbol] = data_frame
+
+    return data
+
+
 def check_partial(
         data_frame: pd.DataFrame,
         stock_param: StockParam) -> List[StockParam]:
@@ -53,42 +95,35 @@ def check_partial(
     gap_param = None
 
     if data_frame is not None:
-        start_year = stock_param.from_date.year
-        end_year = stock_param.to_date.year
-        for year in range(start_year, end_year + 1):
-            if end_year == start_year:
-                # same year
-                start_month = stock_param.from_date.month
-                # stock_param.to_date is excluded
-                end_month = stock_param.to_date.month - 1
-            else:
-                # multiple years
-                start_month = 1 if year > start_year else \
-                                stock_param.from_date.month
-                # stock_param.to_date is excluded
-                end_month = \
-                    12 if year < end_year else stock_param.to_date.month - 1
-
-            for month in range(start_month, end_month + 1):
-                check_mth = date(year=year, month=month, day=1)
-                limit_mth = date(
-                    year=year if month < 12 else year + 1,
-                    month=month + 1 if month < 12 else 1,
-                    day=1
-                )
-                mth_frame = filter_data_frame_by_date(
-                    data_frame, check_mth, limit_mth, DfColumn.DATE.title)
-                if len(mth_frame) == 0:
-                    # no data for check_mth
-                    if not gap_param:
-                        # new gap
-                        gap_param = StockParam(stock_param.symbol)
-                        gap_param.set_from_date(check_mth)
-                    gap_param.set_to_date(limit_mth)
-                elif gap_param:
-                    # save gap
-                    gaps.append(gap_param)
-                    gap_param = None
+        # stock_param.to_date is excluded
+        first = pd.Period(stock_param.from_date, freq='M').ordinal
+        last = (pd.Period(stock_param.to_date, freq='M') - 1).ordinal
+
+        # months with data, found in a single pass of the data
+        months = pd.to_datetime(
+            data_frame[DfColumn.DATE.title]).dt.to_period('M').array.asi8
+        have_data = set(np.unique(
+            months[(months >= first) & (months <= last)]).tolist())
+
+        if len(have_data) == last - first + 1:
+            # data for every month, nothing to check
+            return gaps
+
+        for ordinal in range(first, last + 1):
+            if ordinal not in have_data:
+                # no data for month
+                period = pd.Period(ordinal=ordinal, freq='M')
+                check_mth = period.start_time.date()
+                limit_mth = (period + 1).start_time.date()
+                if not gap_param:
+                    # new gap
+                    gap_param = StockParam(stock_param.symbol)
+                    gap_param.set_from_date(check_mth)
+                gap_param.set_to_date(limit_mth)
+            elif gap_param:
+                # save gap
+                gaps.append(gap_param)
+                gap_param = None
 
         if gap_param:
             # save last gap
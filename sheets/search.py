@@ -4,17 +4,15 @@ Google Sheets search related functions
 import re
 from typing import List, Union
 from gspread.worksheet import Worksheet
-from gspread.cell import Cell
 
 from stock import CompanyColumn, Company
 from utils import Pagination, info
 
-from .find_info import find_all
 from .load_sheet import (
     companies_sheet, eft_sheet, mutual_sheet, future_sheet, index_sheet
 )
 from .utils import cells_range
-from .spread_ops import sheet_batch_get
+from .spread_ops import sheet_batch_get, sheet_get_values
 
 DEFAULT_PAGE_SIZE = 10
 
@@ -74,11 +72,21 @@ def search_meta(
 
     if sheet:
         criteria = criteria.strip()
-        pattern = criteria if exact_match else \
-            re.compile(rf".*{criteria}.*", flags=re.IGNORECASE)
+        pattern = None if exact_match else \
+            re.compile(re.escape(criteria), flags=re.IGNORECASE)
 
         info(f"Searching for '{criteria}'")
-        matches: List[Cell] = find_all(sheet, pattern, col=col.value)
+        # only read the column being searched, Worksheet::findall reads
+        # the whole worksheet
+        column = sheet_get_values(
+            sheet, cells_range(1, col.value, sheet.row_count, col.value))
+        matches: List[int] = [
+            row for row, values in enumerate(column, start=1)
+            if values and (
+                values[0] == criteria if exact_match
+                else pattern.search(values[0])
+            )
+        ]
 
         # The pagination implementation is required as,
         # Worksheet::batch_get passes the ranges as parameters in the url.
@@ -90,8 +98,8 @@ def search_meta(
             # e.g. 'A1:E1'
             # Note: rows/cols are 1-based
             ranges = [
-                cells_range(cell.row, 1, cell.row, len(CompanyColumn))
-                for cell in matches
+                cells_range(row, 1, row, len(CompanyColumn))
+                for row in matches
             ]
 
             def get_page(pg_ranges: List[str]):
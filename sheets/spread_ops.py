@@ -29,10 +29,7 @@ def sheet_find(sheet: gspread.worksheet.Worksheet,
             case_sensitive=case_sensitive)
 
     google_read_manager().acquire()
-    try:
-        result = google_read_manager().perform(operation_func)
-    finally:
-        google_read_manager().release()
+    result = google_read_manager().perform(operation_func)
 
     return result
 
@@ -54,10 +51,7 @@ def sheet_findall(sheet: gspread.worksheet.Worksheet,
             case_sensitive=case_sensitive)
 
     google_read_manager().acquire()
-    try:
-        result = google_read_manager().perform(operation_func)
-    finally:
-        google_read_manager().release()
+    result = google_read_manager().perform(operation_func)
 
     return result
 
@@ -77,10 +71,7 @@ def sheet_get_values(sheet: gspread.worksheet.Worksheet,
         return sheet.get_values(range_name, **kwargs)
 
     google_read_manager().acquire()
-    try:
-        result = google_read_manager().perform(operation_func)
-    finally:
-        google_read_manager().release()
+    result = google_read_manager().perform(operation_func)
 
     return result
 
@@ -109,10 +100,7 @@ def sheet_append_row(
             include_values_in_response=include_values_in_response)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -141,10 +129,7 @@ def sheet_append_rows(
             include_values_in_response=include_values_in_response)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -163,10 +148,7 @@ def sheet_batch_update(sheet: gspread.worksheet.Worksheet, data, **kwargs):
         return sheet.batch_update(data, **kwargs)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -185,10 +167,7 @@ def sheet_clear(sheet: gspread.worksheet.Worksheet):
         return sheet.clear()
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -207,10 +186,7 @@ def sheet_batch_format(sheet: gspread.worksheet.Worksheet, formats):
         return sheet.batch_format(formats)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -229,10 +205,7 @@ def sheet_batch_get(sheet: gspread.worksheet.Worksheet, ranges, **kwargs):
         return sheet.batch_get(ranges, **kwargs)
 
     google_read_manager().acquire()
-    try:
-        result = google_read_manager().perform(operation_func)
-    finally:
-        google_read_manager().release()
+    result = google_read_manager().perform(operation_func)
 
     return result
 
@@ -253,10 +226,28 @@ def spreadsheet_worksheets(spreadsheet: gspread.spreadsheet.Spreadsheet):
         return spreadsheet.worksheets()
 
     google_read_manager().acquire()
-    try:
-        result = google_read_manager().perform(operation_func)
-    finally:
-        google_read_manager().release()
+    result = google_read_manager().perform(operation_func)
+
+    return result
+
+
+def spreadsheet_values_batch_get(
+        spreadsheet: gspread.spreadsheet.Spreadsheet, ranges, params=None):
+    """
+    Returns one or more ranges of values from a spreadsheet.
+
+    Args:
+        spreadsheet: (gspread.spreadsheet.Spreadsheet):
+                spreadsheet to get values from
+
+    For other details see
+        https://docs.gspread.org/en/v5.4.0/api/models/spreadsheet.html#gspread.spreadsheet.Spreadsheet.values_batch_get
+    """
+    def operation_func() -> Any:
+        return spreadsheet.values_batch_get(ranges, params=params)
+
+    google_read_manager().acquire()
+    result = google_read_manager().perform(operation_func)
 
     return result
 
@@ -277,10 +268,7 @@ def spreadsheet_add_worksheet(spreadsheet: gspread.spreadsheet.Spreadsheet,
         return spreadsheet.add_worksheet(title, rows, cols, index=index)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -301,10 +289,7 @@ def spreadsheet_del_worksheet(
         return spreadsheet.del_worksheet(worksheet)
 
     google_write_manager().acquire()
-    try:
-        result = google_write_manager().perform(operation_func)
-    finally:
-        google_write_manager().release()
+    result = google_write_manager().perform(operation_func)
 
     return result
 
@@ -334,7 +319,5 @@ def client_open_spreadsheet(name: str) -> gspread.spreadsheet.Spreadsheet:
         error(f"Spreadsheet {name} not found")
     except google.auth.exceptions.GoogleAuthError:
         error(SHEETS_ERR_MSG)
-    finally:
-        google_read_manager().release()
 
     return spreadsheet
@@ -10,7 +10,7 @@ import pandas as pd
 from .enums import DfColumn, CompanyColumn
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StockParam:
     """
     Class representing parameters for a stock
@@ -206,31 +206,36 @@ class StockDownload:
         """
         # split comma-separated string into list of strings
         # https://numpy.org/doc/stable/reference/arrays.ndarray.html
-        #
-        # Setting arr.dtype is discouraged and may be deprecated in the future.
-        # Setting will replace the dtype without modifying the memory
-        # https://numpy.org/doc/stable/reference/generated/numpy.ndarray.dtype.html#numpy.ndarray.dtype
+        columns = DfColumn.titles()
         data_records = np.array(
-            [entry.split(",") for entry in data]
-        )
-        # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.from_records.html#pandas.DataFrame.from_records
-        data_frame = pd.DataFrame.from_records(
-            data_records, columns=DfColumn.titles())
-
-        # set any nulls to 0
-        data_frame = data_frame.where(data_frame != 'null', 0)
-
-        # convert numeric columns
-        # https://pandas.pydata.org/docs/reference/api/pandas.to_numeric.html
-        for column in DfColumn.NUMERIC_COLUMNS:
-            data_frame[column.title] = pd.to_numeric(data_frame[column.title])
+            [entry.split(",") for entry in data], dtype=str
+        ).reshape(-1, len(columns))
+
+        # convert numeric columns in a single pass, setting any nulls to 0,
+        # rather than building a frame of strings and converting it
+        date_idx = columns.index(DfColumn.DATE.title)
+        numeric_idx = [
+            columns.index(column.title) for column in DfColumn.NUMERIC_COLUMNS
+        ]
+        numeric = data_records[:, numeric_idx]
+        numeric[numeric == 'null'] = '0'
+        numeric = numeric.astype(np.float64)
 
         # convert date column
         # https://pandas.pydata.org/docs/reference/api/pandas.to_datetime.html#pandas.to_datetime
-        data_frame[DfColumn.DATE.title] = pd.to_datetime(
-            data_frame[DfColumn.DATE.title].str.lower(),
-            infer_datetime_format=True
-        )
+        converted = {
+            DfColumn.DATE.title: pd.to_datetime(
+                np.char.lower(data_records[:, date_idx]),
+                infer_datetime_format=True
+            )
+        }
+        for index, column in enumerate(DfColumn.NUMERIC_COLUMNS):
+            converted[column.title] = numeric[:, index] \
+                if column != DfColumn.VOLUME \
+                else numeric[:, index].astype(np.int64)
+
+        data_frame = pd.DataFrame(
+            {column: converted[column] for column in columns})
 
         return data_frame
 
@@ -252,6 +257,8 @@ class Company:
     currency: str
     """ Stock currency """
 
+    __slots__ = ('code', 'symbol', 'name', 'sector', 'currency', '_label')
+
     def __init__(
             self, code: str, symbol: str, name: str, sector: str,
             currency: str):
@@ -260,6 +267,19 @@ class Company:
         self.name = name
         self.sector = sector
         self.currency = currency
+        self._label = None
+
+    @property
+    def label(self) -> str:
+        """
+        Display label for this company
+
+        Returns:
+            str: label
+        """
+        if self._label is None:
+            self._label = f'{self.name} [{self.symbol}]'
+        return self._label
 
     @classmethod
     def company_of(
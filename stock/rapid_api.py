@@ -42,11 +42,8 @@ def rapid_get(url: str, **kwargs) -> requests.Response:
         return api_response
 
     rapidapi_read_manager().acquire()
-    try:
-        response = rapidapi_read_manager()\
-            .perform(operation_func, check_func=check_func)
-    finally:
-        rapidapi_read_manager().release()
+    response = rapidapi_read_manager()\
+        .perform(operation_func, check_func=check_func)
 
     return response
 
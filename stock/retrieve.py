@@ -56,14 +56,13 @@ def _get_crumbs_and_cookies(stock):
     cookies = None
 
     url = YAHOO_HISTORY_URL.format(stock)
-    with requests.session():
-        website = http_get(url, headers=HEADER)
-        if website:
-            soup = BeautifulSoup(website.text, 'lxml')
-            crumbs = re.findall('"CrumbStore":{"crumb":"(.+?)"}', str(soup))
-            if len(crumbs) > 0:
-                crumb = crumbs[0]
-            cookies = website.cookies
+    website = http_get(url, headers=HEADER)
+    if website:
+        soup = BeautifulSoup(website.text, 'lxml')
+        crumbs = re.findall('"CrumbStore":{"crumb":"(.+?)"}', str(soup))
+        if len(crumbs) > 0:
+            crumb = crumbs[0]
+        cookies = website.cookies
 
     return HEADER, crumb, cookies
 
@@ -129,42 +128,41 @@ def download_stock_data(
 
     data = None
     status_code = StockDownload.NO_RESPONSE
-    with requests.session():
-        response = yahoo_get(url, headers=header, cookies=cookies)
-        if response is not None:
-            status_code = response.status_code
-
-            if response.status_code == 200:
-                # data in form
-                # 'Date,Open,High,Low,Close,Adj Close,Volume\n'
-                # '2022-01-03,134.070007,136.289993,133.630005,136.039993,
-                #       132.809769,4605900'
-
-                data = response.text.split('\n')
-
-                data = data[1:]     # drop header row
-
-            elif response.status_code >= 400:
-                msg = response.text
-                if response.status_code == 400:
-                    # no data, e.g. "400 Bad Request: Data doesn't exist for
-                    #              startDate = 633830400, endDate = 638924400"
-                    match = NO_DATA_REGEX.match(response.text)
-                    if match:
-                        na_from = friendly_date(
-                                        _epoch_datetime(match.group(1)))
-                        na_to = friendly_date(_epoch_datetime(match.group(2)))
-                        msg = f"Data doesn't exist for date range "\
-                            f"{na_from} to {na_to}"
-                elif response.status_code == 404:
-                    # not found, e.g. "404 Not Found: No data found, symbol
-                    #                   may be delisted"
-                    match = NO_SYMBOL_REGEX.match(response.text)
-                    if match:
-                        msg = f"No data found, "\
-                              f"symbol '{load_param.symbol}' may be delisted"
-
-                error(msg)
+    response = yahoo_get(url, headers=header, cookies=cookies)
+    if response is not None:
+        status_code = response.status_code
+
+        if response.status_code == 200:
+            # data in form
+            # 'Date,Open,High,Low,Close,Adj Close,Volume\n'
+            # '2022-01-03,134.070007,136.289993,133.630005,136.039993,
+            #       132.809769,4605900'
+
+            data = response.text.split('\n')
+
+            data = data[1:]     # drop header row
+
+        elif response.status_code >= 400:
+            msg = response.text
+            if response.status_code == 400:
+                # no data, e.g. "400 Bad Request: Data doesn't exist for
+                #              startDate = 633830400, endDate = 638924400"
+                match = NO_DATA_REGEX.match(response.text)
+                if match:
+                    na_from = friendly_date(
+                                    _epoch_datetime(match.group(1)))
+                    na_to = friendly_date(_epoch_datetime(match.group(2)))
+                    msg = f"Data doesn't exist for date range "\
+                        f"{na_from} to {na_to}"
+            elif response.status_code == 404:
+                # not found, e.g. "404 Not Found: No data found, symbol
+                #                   may be delisted"
+                match = NO_SYMBOL_REGEX.match(response.text)
+                if match:
+                    msg = f"No data found, "\
+                          f"symbol '{load_param.symbol}' may be delisted"
+
+            error(msg)
 
     return StockDownload(params, data, status_code)
 
@@ -184,9 +182,6 @@ def yahoo_get(url: str, **kwargs) -> requests.Response:
         return http_get(url, **kwargs)
 
     yahoo_read_manager().acquire()
-    try:
-        response = yahoo_read_manager().perform(operation_func)
-    finally:
-        yahoo_read_manager().release()
+    response = yahoo_read_manager().perform(operation_func)
 
     return response
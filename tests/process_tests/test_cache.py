@@ -0,0 +1,165 @@
+"""
+Unit tests for local data cache functions
+"""
+import os
+import tempfile
+from datetime import date, timedelta
+from unittest import TestCase, mock, main
+
+import pandas as pd
+
+import process.cache as cache
+from process.cache import (
+    read_cached_stock_data, cache_stock_data, clear_cache
+)
+from stock import StockParam, DfColumn
+from utils import CACHE_PATH_ENV, CACHE_TTL_ENV
+
+JAN, FEB, MAR, APR = 1, 2, 3, 4
+
+
+def stock_frame(from_date: date, to_date: date) -> pd.DataFrame:
+    """
+    Generate stock data for business days in a date range
+
+    Args:
+        from_date (date): from date (inclusive)
+        to_date (date): to date (exclusive)
+
+    Returns:
+        pd.DataFrame: data frame
+    """
+    dates = pd.bdate_range(from_date, to_date - timedelta(days=1)).date
+    data = {DfColumn.DATE.title: dates}
+    for column in DfColumn.NUMERIC_COLUMNS:
+        data[column.title] = range(1, len(dates) + 1)
+    return pd.DataFrame(data)
+
+
+class TestCache(TestCase):
+    """
+    Units tests for local data cache functions
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.env_patcher = mock.patch.dict(os.environ, {
+            CACHE_PATH_ENV: os.path.join(self.temp_dir.name, 'test.db'),
+        })
+        self.env_patcher.start()
+        # use a new database for each test
+        cache._CONNECTION = None
+
+    def tearDown(self):
+        cache.cache_connection().close()
+        cache._CONNECTION = None
+        self.env_patcher.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def param(from_date: date, to_date: date) -> StockParam:
+        """ Generate stock parameters for the test symbol """
+        return StockParam.stock_param_of('X', from_date, to_date)
+
+    def cache_range(self, from_date: date, to_date: date):
+        """ Cache stock data which completely covers a date range """
+        cache_stock_data(
+            self.param(from_date, to_date), stock_frame(from_date, to_date))
+
+    def test_read_cached(self):
+        """
+        Test cached data is read
+        """
+        self.cache_range(date(2022, JAN, 1), date(2022, APR, 1))
+
+        data_frame = read_cached_stock_data(
+            self.param(date(2022, FEB, 1), date(2022, MAR, 1)))
+        self.assertIsNotNone(data_frame)
+        self.assertListEqual(
+            data_frame[DfColumn.DATE.title].tolist(),
+            stock_frame(
+                date(2022, FEB, 1), date(2022, MAR, 1)
+            )[DfColumn.DATE.title].tolist()
+        )
+
+    def test_partial_range(self):
+        """
+        Test data isn't read for a date range only partly cached
+        """
+        # data cached mid-month doesn't cover the start of the month
+        self.cache_range(date(2022, JAN, 15), date(2022, APR, 1))
+
+        self.assertIsNone(read_cached_stock_data(
+            self.param(date(2022, JAN, 1), date(2022, APR, 1))))
+        self.assertIsNone(read_cached_stock_data(
+            self.param(date(2022, JAN, 15), date(2022, APR, 15))))
+        self.assertIsNotNone(read_cached_stock_data(
+            self.param(date(2022, JAN, 15), date(2022, APR, 1))))
+
+    def test_combined_ranges(self):
+        """
+        Test data is read for a date range covered by multiple cached ranges
+        """
+        self.cache_range(date(2022, JAN, 1), date(2022, FEB, 1))
+        self.cache_range(date(2022, MAR, 1), date(2022, APR, 1))
+
+        request = self.param(date(2022, JAN, 1), date(2022, APR, 1))
+        self.assertIsNone(read_cached_stock_data(request))
+
+        # fill the gap
+        self.cache_range(date(2022, FEB, 1), date(2022, MAR, 1))
+        data_frame = read_cached_stock_data(request)
+        self.assertIsNotNone(data_frame)
+        self.assertEqual(
+            len(data_frame),
+            len(stock_frame(date(2022, JAN, 1), date(2022, APR, 1))))
+
+        # multiple ranges in a single save
+        clear_cache()
+        cache_stock_data([
+            self.param(date(2022, JAN, 1), date(2022, FEB, 1)),
+            self.param(date(2022, FEB, 1), date(2022, APR, 1)),
+        ], stock_frame(date(2022, JAN, 1), date(2022, APR, 1)))
+        self.assertIsNotNone(read_cached_stock_data(request))
+
+    def test_current_day(self):
+        """
+        Test current day's data isn't cached
+        """
+        today = date.today()
+        from_date = today - timedelta(days=30)
+        self.cache_range(from_date, today + timedelta(days=1))
+
+        # cached to the current day (exclusive)
+        data_frame = read_cached_stock_data(self.param(from_date, today))
+        self.assertIsNotNone(data_frame)
+        self.assertTrue(
+            (data_frame[DfColumn.DATE.title] < today).all())
+        self.assertIsNone(read_cached_stock_data(
+            self.param(from_date, today + timedelta(days=1))))
+
+    def test_expired(self):
+        """
+        Test expired data isn't read
+        """
+        self.cache_range(date(2022, JAN, 1), date(2022, APR, 1))
+        request = self.param(date(2022, JAN, 1), date(2022, APR, 1))
+        self.assertIsNotNone(read_cached_stock_data(request))
+
+        with mock.patch.dict(os.environ, {CACHE_TTL_ENV: '0'}):
+            self.assertIsNone(read_cached_stock_data(request))
+
+    def test_clear(self):
+        """
+        Test clear cache
+        """
+        self.cache_range(date(2022, JAN, 1), date(2022, APR, 1))
+        clear_cache()
+        self.assertIsNone(read_cached_stock_data(
+            self.param(date(2022, JAN, 1), date(2022, APR, 1))))
+
+
+if __name__ == '__main__':
+    main()
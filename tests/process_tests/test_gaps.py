@@ -0,0 +1,318 @@
+"""
+Unit tests for gap filling functions, with downloads stubbed
+"""
+from datetime import date, timedelta
+from threading import Lock
+from time import perf_counter, sleep
+from typing import List
+from unittest import TestCase, mock, main
+
+import pandas as pd
+
+import process.basic as basic
+import stock.retrieve as retrieve
+from process.basic import (
+    fill_gaps, _group_gaps, _download_gaps, _stack_frames
+)
+from stock import StockParam, StockDownload, DfColumn
+
+JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC = range(1, 13)
+
+
+def stock_frame(from_date: date, to_date: date,
+                timestamps: bool = False) -> pd.DataFrame:
+    """
+    Generate stock data for business days in a date range
+
+    Args:
+        from_date (date): from date (inclusive)
+        to_date (date): to date (exclusive)
+        timestamps (bool, optional): dates as timestamps, as downloaded,
+                                    rather than dates, as read from sheets.
+                                    Defaults to False.
+
+    Returns:
+        pd.DataFrame: data frame
+    """
+    dates = pd.bdate_range(from_date, to_date - timedelta(days=1))
+    data = {DfColumn.DATE.title: dates if timestamps else dates.date}
+    for column in DfColumn.NUMERIC_COLUMNS:
+        data[column.title] = [float(day.day) for day in dates]
+    return pd.DataFrame(data)
+
+
+class StubDownload:
+    """
+    Stub for stock data downloads. Requests are made via the Yahoo quota
+    manager, with the http request stubbed.
+    """
+
+    VALUE_OFFSET = 100
+    """ Offset of downloaded values from values read from sheets """
+
+    def __init__(self, delay: float = 0, fail_from: List[date] = None,
+                 extra_days: int = 0):
+        """
+        Constructor
+
+        Args:
+            delay (float, optional): download duration in seconds.
+                                    Defaults to 0.
+            fail_from (List[date], optional): from dates of downloads
+                                            which fail. Defaults to None.
+            extra_days (int, optional): number of days before and after
+                                        the requested range to return.
+                                        Defaults to 0.
+        """
+        self.delay = delay
+        self.fail_from = fail_from if fail_from else []
+        self.extra_days = extra_days
+        self.params = []
+        self.lock = Lock()
+
+    def __call__(self, stock_param: StockParam) -> StockDownload:
+        with self.lock:
+            self.params.append(stock_param)
+        retrieve.yahoo_get('')
+        if stock_param.from_date in self.fail_from:
+            return StockDownload(stock_param, None, 404)
+        extra = timedelta(days=self.extra_days)
+        data_frame = stock_frame(
+            stock_param.from_date - extra, stock_param.to_date + extra,
+            timestamps=True)
+        for column in DfColumn.NUMERIC_COLUMNS:
+            data_frame[column.title] += self.VALUE_OFFSET
+        return StockDownload(stock_param, data_frame, 200)
+
+
+class TestGaps(TestCase):
+    """
+    Units tests for gap filling functions
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.download = StubDownload()
+        self.patchers = [
+            mock.patch.object(basic, 'download_stock_data', self.download),
+            mock.patch.object(
+                retrieve, 'http_get',
+                lambda url, **kwargs: sleep(self.download.delay)),
+            mock.patch.object(basic, 'save_stock_data'),
+            mock.patch.object(basic, 'cache_stock_data'),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        super().tearDown()
+
+    @staticmethod
+    def param(from_date: date, to_date: date) -> StockParam:
+        """ Generate stock parameters for the test symbol """
+        return StockParam.stock_param_of('X', from_date, to_date)
+
+    def test_concurrent_downloads(self):
+        """
+        Test gap downloads are performed concurrently
+        """
+        self.download.delay = 0.4
+        # gaps in Jan, May & Sep, far enough apart to be downloaded
+        # separately
+        data_frame = pd.concat([
+            stock_frame(date(2022, month, 1), date(2022, month + 3, 1))
+            for month in [FEB, JUN]
+        ] + [stock_frame(date(2022, OCT, 1), date(2023, JAN, 1))],
+            ignore_index=True)
+
+        start = perf_counter()
+        fill_gaps(
+            data_frame, self.param(date(2022, JAN, 1), date(2023, JAN, 1)))
+        duration = perf_counter() - start
+
+        self.assertEqual(len(self.download.params), 3)
+        # sequential downloads would take 1.2s
+        self.assertLess(duration, 0.8)
+
+    def test_group_gaps(self):
+        """
+        Test gaps are grouped while at least half of the range is missing
+        """
+        start = date(2022, JAN, 3)
+
+        def gap(from_day: int, to_day: int) -> StockParam:
+            return self.param(start + timedelta(days=from_day),
+                              start + timedelta(days=to_day))
+
+        for gaps, expected in [
+            # 20 of 30 days missing
+            ([gap(0, 10), gap(20, 30)], [[0, 1]]),
+            # 20 of 40 days missing, exactly half
+            ([gap(0, 10), gap(30, 40)], [[0, 1]]),
+            # 20 of 41 days missing
+            ([gap(0, 10), gap(31, 41)], [[0], [1]]),
+            # missing days accumulate, 30 of 60 days missing
+            ([gap(0, 10), gap(20, 30), gap(50, 60)], [[0, 1, 2]]),
+            # new group starts after a gap too far away
+            ([gap(0, 10), gap(31, 41), gap(45, 55)], [[0], [1, 2]]),
+            ([gap(0, 10)], [[0]]),
+            ([], []),
+        ]:
+            with self.subTest(gaps=[str(param) for param in gaps]):
+                self.assertListEqual(_group_gaps(gaps), [
+                    [gaps[index] for index in group] for group in expected
+                ])
+
+    def test_download_gaps_split(self):
+        """
+        Test a group download is split by gap, from date inclusive and
+        to date exclusive
+        """
+        # Mondays, so the to dates have data
+        gaps = [
+            self.param(date(2022, JAN, 3), date(2022, JAN, 10)),
+            self.param(date(2022, JAN, 17), date(2022, JAN, 24)),
+        ]
+        downloads = _download_gaps(gaps)
+
+        # single download for the group
+        self.assertEqual(len(self.download.params), 1)
+        self.assertEqual(self.download.params[0].from_date, gaps[0].from_date)
+        self.assertEqual(self.download.params[0].to_date, gaps[1].to_date)
+
+        self.assertEqual(len(downloads), len(gaps))
+        for download, gap in zip(downloads, gaps):
+            with self.subTest(gap=str(gap)):
+                self.assertTrue(download.response_ok)
+                self.assertIs(download.stock_param, gap)
+                self.assertListEqual(
+                    download.data_frame[DfColumn.DATE.title].tolist(),
+                    stock_frame(gap.from_date, gap.to_date, timestamps=True)[
+                        DfColumn.DATE.title].tolist()
+                )
+
+        # single gap is downloaded as is
+        self.assertEqual(_download_gaps(gaps[:1])[0].stock_param, gaps[0])
+        self.assertEqual(len(self.download.params), 2)
+
+    def test_download_gaps_failed(self):
+        """
+        Test a failed group download
+        """
+        gaps = [
+            self.param(date(2022, JAN, 3), date(2022, JAN, 10)),
+            self.param(date(2022, JAN, 17), date(2022, JAN, 24)),
+        ]
+        self.download.fail_from = [gaps[0].from_date]
+
+        downloads = _download_gaps(gaps)
+        self.assertEqual(len(downloads), 1)
+        self.assertFalse(downloads[0].response_ok)
+
+    def test_fill_gaps_failed(self):
+        """
+        Test existing data is returned, and downloaded gaps saved, when
+        gap downloads fail
+        """
+        stock_param = self.param(date(2022, JAN, 1), date(2023, JAN, 1))
+        # gaps in Jan & Dec, downloaded separately
+        data_frame = stock_frame(date(2022, FEB, 1), date(2022, DEC, 1))
+
+        self.download.fail_from = [date(2022, JAN, 1), date(2022, DEC, 1)]
+        result = fill_gaps(data_frame, stock_param)
+        self.assertIs(result, data_frame)
+        basic.save_stock_data.assert_not_called()
+        basic.cache_stock_data.assert_not_called()
+
+        # Jan download fails, Dec saved
+        self.download.fail_from = [date(2022, JAN, 1)]
+        result = fill_gaps(data_frame, stock_param)
+        dec_frame = stock_frame(date(2022, DEC, 1), date(2023, JAN, 1))
+        self.assertEqual(len(result), len(data_frame) + len(dec_frame))
+        basic.save_stock_data.assert_called_once()
+        saved = basic.save_stock_data.call_args.args[0]
+        self.assertEqual(len(saved), len(dec_frame))
+        cached_params = basic.cache_stock_data.call_args.args[0]
+        self.assertListEqual(
+            [(param.from_date, param.to_date) for param in cached_params],
+            [(date(2022, DEC, 1), date(2023, JAN, 1))]
+        )
+
+    def test_fill_gaps_overlap(self):
+        """
+        Test overlapping sheet and downloaded data are combined in date
+        order, without duplicate dates
+        """
+        stock_param = self.param(date(2022, JAN, 1), date(2022, APR, 1))
+        # gap in Feb, download overlaps Jan & Mar data
+        data_frame = pd.concat([
+            stock_frame(date(2022, JAN, 1), date(2022, FEB, 1)),
+            stock_frame(date(2022, MAR, 1), date(2022, APR, 1)),
+        ], ignore_index=True)
+        self.download.extra_days = 7
+
+        result = fill_gaps(data_frame, stock_param)
+
+        dates = result[DfColumn.DATE.title]
+        expected = stock_frame(
+            date(2022, JAN, 1), date(2022, APR, 1), timestamps=True)
+        self.assertListEqual(
+            dates.tolist(), expected[DfColumn.DATE.title].tolist())
+        self.assertTrue(dates.is_unique)
+        self.assertTrue(dates.is_monotonic_increasing)
+        self.assertListEqual(list(result.index), list(range(len(result))))
+
+        # all gaps filled, so the whole range is cached
+        basic.cache_stock_data.assert_called_once()
+        cached_param, cached_frame = basic.cache_stock_data.call_args.args
+        self.assertIs(cached_param, stock_param)
+        self.assertIs(cached_frame, result)
+
+        # downloaded values replace sheet values for overlapping dates
+        downloaded = (
+            dates >= pd.Timestamp(date(2022, JAN, 25))
+        ) & (dates < pd.Timestamp(date(2022, MAR, 8)))
+        close = result[DfColumn.CLOSE.title]
+        self.assertTrue(
+            (close[downloaded] > StubDownload.VALUE_OFFSET).all())
+        self.assertTrue(
+            (close[~downloaded] < StubDownload.VALUE_OFFSET).all())
+
+    def test_stack_frames(self):
+        """
+        Test stacking frames
+        """
+        sheet_frame = stock_frame(date(2022, JAN, 1), date(2022, FEB, 1))
+        download_frame = stock_frame(
+            date(2022, FEB, 1), date(2022, MAR, 1), timestamps=True)
+        expected_dates = stock_frame(
+            date(2022, JAN, 1), date(2022, MAR, 1), timestamps=True
+        )[DfColumn.DATE.title].tolist()
+
+        # columns in different order are matched by name
+        reordered = download_frame[download_frame.columns[::-1]]
+        stacked = _stack_frames([sheet_frame, reordered])
+        self.assertListEqual(list(stacked.columns), list(sheet_frame.columns))
+        self.assertListEqual(
+            stacked[DfColumn.DATE.title].tolist(), expected_dates)
+        pd.testing.assert_series_equal(
+            stacked[DfColumn.OPEN.title],
+            pd.concat([
+                sheet_frame[DfColumn.OPEN.title],
+                download_frame[DfColumn.OPEN.title]
+            ], ignore_index=True)
+        )
+
+        # different columns
+        extra = download_frame.assign(Extra=1)
+        stacked = _stack_frames([sheet_frame, extra])
+        self.assertEqual(len(stacked), len(expected_dates))
+        self.assertListEqual(
+            stacked[DfColumn.DATE.title].tolist(), expected_dates)
+        self.assertIn('Extra', stacked.columns)
+
+
+if __name__ == '__main__':
+    main()
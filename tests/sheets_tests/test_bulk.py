@@ -0,0 +1,93 @@
+"""
+Unit tests for bulk data load, not requiring sheets access
+"""
+from datetime import date
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+import sheets.load_data as load_data
+from sheets import get_sheets_data_bulk
+from stock import StockParam, DfColumn
+
+from .sheet_utils import JAN, FEB, MAR
+
+
+def sheet_values(dates: list, value: float) -> list:
+    """
+    Generate sheet values
+
+    Args:
+        dates (list): dates
+        value (float): value for numeric columns
+
+    Returns:
+        list: values
+    """
+    return [
+        [day.isoformat()] + [str(value)] * len(DfColumn.NUMERIC_COLUMNS)
+        for day in dates
+    ]
+
+
+class TestBulk(unittest.TestCase):
+    """
+    Units tests for bulk data load
+    """
+
+    def test_bulk(self):
+        """
+        Test data for multiple stocks is read with a single request
+        """
+        values = {
+            'A': sheet_values(
+                [date(2022, JAN, 31), date(2022, FEB, 1), date(2022, MAR, 1)],
+                1),
+            'C': sheet_values([date(2022, MAR, 1)], 3),
+            'D': sheet_values([date(2022, FEB, 14)], 4),
+            'E': None,
+        }
+        worksheets = [SimpleNamespace(title=title) for title in values]
+        requested = []
+
+        def batch_get(_, ranges):
+            requested.append(ranges)
+            return {'valueRanges': [
+                # range names are quoted sheet titles, e.g. "'A'"
+                # no values for an empty sheet
+                {'values': values[name.split("'")[1]]}
+                if values[name.split("'")[1]] else {}
+                for name in ranges
+            ]}
+
+        stock_params = [
+            StockParam.stock_param_of(
+                symbol, date(2022, FEB, 1), date(2022, MAR, 1))
+            for symbol in ['A', 'B', 'C', 'D', 'E']
+        ]
+        with mock.patch.object(load_data, 'init_spreadsheet',
+                               return_value=object()), \
+                mock.patch.object(load_data, 'spreadsheet_worksheets',
+                                  return_value=worksheets), \
+                mock.patch.object(load_data, 'spreadsheet_values_batch_get',
+                                  side_effect=batch_get):
+            data = get_sheets_data_bulk(stock_params)
+
+        # single request for stocks with sheets, in the order requested
+        self.assertEqual(len(requested), 1)
+        self.assertListEqual(
+            [name.split("'")[1] for name in requested[0]],
+            ['A', 'C', 'D', 'E'])
+
+        # no sheet for B, no data in range for C, empty sheet for E
+        self.assertListEqual(sorted(data), ['A', 'D'])
+        self.assertListEqual(
+            data['A'][DfColumn.DATE.title].tolist(), [date(2022, FEB, 1)])
+        self.assertListEqual(data['A'][DfColumn.CLOSE.title].tolist(), [1])
+        self.assertListEqual(
+            data['D'][DfColumn.DATE.title].tolist(), [date(2022, FEB, 14)])
+        self.assertListEqual(data['D'][DfColumn.CLOSE.title].tolist(), [4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for partial data check, not requiring sheets access
+"""
+from datetime import date
+import unittest
+import pandas as pd
+
+from sheets import check_partial
+from stock import StockParam, DfColumn
+
+from .sheet_utils import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG
+
+
+class TestPartial(unittest.TestCase):
+    """
+    Units tests for partial data check
+    """
+
+    @staticmethod
+    def data_frame(dates):
+        """
+        Generate a data frame with the specified dates
+
+        Args:
+            dates (list): dates
+
+        Returns:
+            pd.DataFrame: data frame
+        """
+        return pd.DataFrame({DfColumn.DATE.title: dates})
+
+    def test_no_data(self):
+        """
+        Test no data is a single gap
+        """
+        stock_param = StockParam.stock_param_of(
+            "x", date(2022, JAN, 1), date(2022, JUL, 1))
+        self.assertListEqual(check_partial(None, stock_param), [stock_param])
+
+    def test_gaps(self):
+        """
+        Test gaps found
+        """
+        stock_param = StockParam.stock_param_of(
+            "x", date(2022, JAN, 1), date(2022, JUL, 1))
+        data_frame = self.data_frame([
+            date(2022, JAN, 10), date(2022, MAR, 3), date(2022, JUN, 30)
+        ])
+        self.assertListEqual(check_partial(data_frame, stock_param), [
+            StockParam.stock_param_of(
+                "x", date(2022, FEB, 1), date(2022, MAR, 1)),
+            StockParam.stock_param_of(
+                "x", date(2022, APR, 1), date(2022, JUN, 1)),
+        ])
+
+    def test_complete(self):
+        """
+        Test no gaps found when every month has data
+        """
+        stock_param = StockParam.stock_param_of(
+            "x", date(2022, JAN, 15), date(2022, APR, 1))
+        data_frame = self.data_frame([
+            date(2021, AUG, 31), date(2022, JAN, 31), date(2022, FEB, 1),
+            date(2022, MAR, 31)
+        ])
+        self.assertListEqual(check_partial(data_frame, stock_param), [])
+
+        # data outside the range doesn't fill a gap
+        data_frame = self.data_frame([
+            date(2022, JAN, 31), date(2022, MAR, 31), date(2022, APR, 1)
+        ])
+        self.assertListEqual(check_partial(data_frame, stock_param), [
+            StockParam.stock_param_of(
+                "x", date(2022, FEB, 1), date(2022, MAR, 1)),
+        ])
+
+    def test_timestamps_multi_year(self):
+        """
+        Test gaps found with timestamp dates over multiple years
+        """
+        stock_param = StockParam.stock_param_of(
+            "x", date(2021, MAY, 1), date(2022, FEB, 1))
+        data_frame = self.data_frame(pd.to_datetime([
+            date(2021, MAY, 4), date(2021, JUN, 1), date(2021, JUL, 1)
+        ]))
+        self.assertListEqual(check_partial(data_frame, stock_param), [
+            StockParam.stock_param_of(
+                "x", date(2021, AUG, 1), date(2022, FEB, 1)),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
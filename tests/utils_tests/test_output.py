@@ -0,0 +1,29 @@
+"""
+Unit tests for output functions
+"""
+import unittest
+
+from utils import Colour, colorise, colour_wrap
+
+
+class TestOutput(unittest.TestCase):
+    """
+    Unit tests for output functions
+    """
+
+    def test_colour_wrap(self):
+        """
+        Test colour wrap matches colorise
+        """
+        for colour in [None, *Colour]:
+            for on_colour in [None, *Colour]:
+                with self.subTest(colour=colour, on_colour=on_colour):
+                    prefix, suffix = colour_wrap(colour, on_colour)
+                    self.assertEqual(
+                        f'{prefix}text{suffix}',
+                        colorise('text', colour=colour, on_colour=on_colour)
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
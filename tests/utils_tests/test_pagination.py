@@ -0,0 +1,82 @@
+"""
+Unit tests for pagination functions
+"""
+import unittest
+
+from utils import Pagination
+
+
+class TestPagination(unittest.TestCase):
+    """
+    Unit tests for pagination functions
+    """
+
+    def test_pages(self):
+        """
+        Test pagination pages
+        """
+        pagination = Pagination(list(range(25)), page_size=10)
+        self.assertEqual(pagination.num_pages, 3)
+        self.assertListEqual(pagination.get_current_page(), list(range(10)))
+        self.assertListEqual(pagination.get_page(3), list(range(20, 25)))
+        self.assertIsNone(pagination.get_page(4))
+
+    def test_transform_cache(self):
+        """
+        Test transformed pages are cached
+        """
+        calls = []
+
+        def transform(items):
+            calls.append(items)
+            return [item * 2 for item in items]
+
+        pagination = Pagination(
+            list(range(25)), page_size=10, transform_func=transform)
+
+        self.assertListEqual(pagination.get_page(2), list(range(20, 40, 2)))
+        self.assertListEqual(pagination.get_page(2), list(range(20, 40, 2)))
+        self.assertEqual(len(calls), 1)
+
+        # untransformed items are not cached
+        self.assertListEqual(
+            pagination.get_page(2, transform=False), list(range(10, 20)))
+
+        # cache is cleared on page size change
+        pagination.set_page_size(5)
+        self.assertListEqual(pagination.get_page(2), list(range(10, 20, 2)))
+        self.assertEqual(len(calls), 2)
+
+        # cache is retained if page size unchanged
+        pagination.set_page_size(5)
+        pagination.get_page(2)
+        self.assertEqual(len(calls), 2)
+
+    def test_copy(self):
+        """
+        Test pagination copy
+        """
+        calls = []
+
+        def transform(items):
+            calls.append(items)
+            return items
+
+        pagination = Pagination(
+            list(range(25)), page_size=10, transform_func=transform)
+        pagination.get_page(3)
+
+        copy = pagination.copy()
+        self.assertEqual(copy.page_num, 1)
+        self.assertEqual(pagination.page_num, 3)
+
+        # transformed pages are shared
+        self.assertListEqual(copy.get_page(3), list(range(20, 25)))
+        copy.get_page(1)
+        self.assertEqual(len(calls), 2)
+        pagination.get_page(1)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Unit tests for quota manager functions
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import perf_counter, sleep
+import unittest
+from unittest import mock
+
+import utils.quota_mgr as quota_mgr
+
+from utils.quota_mgr import (
+    QuotaMgr, LevelQuotaMgr, RateQuotaMgr, TokenBucketQuotaMgr, TimeUnit
+)
+
+
+class TestQuotaMgr(unittest.TestCase):
+    """
+    Unit tests for quota manager functions
+    """
+
+    @staticmethod
+    def perform_ops(manager: QuotaMgr, count: int) -> float:
+        """
+        Perform operations
+
+        Args:
+            manager (QuotaMgr): manager
+            count (int): number of operations
+
+        Returns:
+            float: duration in seconds
+        """
+        start = perf_counter()
+        for _ in range(count):
+            manager.acquire()
+        return perf_counter() - start
+
+    @staticmethod
+    def perform_concurrent_ops(
+            manager: QuotaMgr, count: int, op_secs: float) -> float:
+        """
+        Perform operations concurrently
+
+        Args:
+            manager (QuotaMgr): manager
+            count (int): number of operations
+            op_secs (float): duration of each operation in seconds
+
+        Returns:
+            float: duration in seconds
+        """
+        def operation(_):
+            manager.acquire()
+            manager.perform(lambda: sleep(op_secs))
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(operation, range(count)))
+        return perf_counter() - start
+
+    def test_concurrent(self):
+        """
+        Test operations are performed concurrently
+        """
+        for manager in [
+            QuotaMgr(0), LevelQuotaMgr(100, unit=TimeUnit.SECOND),
+            RateQuotaMgr(100, unit=TimeUnit.SECOND),
+            TokenBucketQuotaMgr(100, unit=TimeUnit.SECOND)
+        ]:
+            with self.subTest(manager=type(manager).__name__):
+                # sequential operations would take 1.2s
+                self.assertLess(
+                    self.perform_concurrent_ops(manager, 4, 0.3), 0.9)
+
+    def test_concurrent_backoff(self):
+        """
+        Test backoff is per operation when operations fail concurrently
+        """
+        manager = QuotaMgr(0)
+        count = 6
+        failed = Barrier(count)
+        waits = []
+
+        def operation(_) -> list:
+            attempts = []
+
+            def operation_func() -> bool:
+                attempts.append(True)
+                retry = len(attempts) > 1
+                if retry:
+                    # all operations fail once before any succeeds
+                    failed.wait()
+                return retry
+
+            return manager.perform(
+                operation_func,
+                check_func=lambda success: (success, 'Quota exceeded'))
+
+        with mock.patch.object(quota_mgr, 'sleep', waits.append), \
+                mock.patch.object(quota_mgr, 'info'):
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                results = list(executor.map(operation, range(count)))
+
+            # every operation retried once after the initial wait
+            self.assertListEqual(results, [True] * count)
+            self.assertEqual(len(waits), count)
+            self.assertTrue(all(wait < 2 for wait in waits))
+
+            # successive failures of an operation increase its wait
+            waits.clear()
+            with mock.patch.object(quota_mgr, 'error'):
+                manager.perform(
+                    lambda: False,
+                    check_func=lambda success: (success, 'Quota exceeded'))
+            self.assertListEqual(
+                [int(wait) for wait in waits], [1, 2, 4, 8, 16, 32, 64, 128])
+
+    def test_level_throttle(self):
+        """
+        Test level manager spaces operation starts
+        """
+        manager = LevelQuotaMgr(10, unit=TimeUnit.SECOND)
+        # starts at 0, 0.1, 0.2, 0.3 & 0.4s
+        self.assertGreaterEqual(
+            self.perform_concurrent_ops(manager, 5, 0), 0.35)
+
+    def test_rate_throttle(self):
+        """
+        Test rate manager waits for the next period once limit is reached
+        """
+        manager = RateQuotaMgr(4, unit=TimeUnit.SECOND, percent=50)
+        # 2 operations per second, so the 3rd waits for the next period
+        self.assertLess(self.perform_ops(manager, 2), 0.25)
+        self.assertGreaterEqual(self.perform_ops(manager, 1), 0.5)
+
+    def test_token_bucket_burst(self):
+        """
+        Test token bucket allows a burst up to capacity
+        """
+        manager = TokenBucketQuotaMgr(5, unit=TimeUnit.SECOND)
+        self.assertLess(self.perform_ops(manager, 5), 0.3)
+
+    def test_token_bucket_throttle(self):
+        """
+        Test token bucket throttles once capacity is used
+        """
+        manager = TokenBucketQuotaMgr(10, unit=TimeUnit.SECOND)
+        self.perform_ops(manager, 10)
+        # next 2 ops need 2 tokens at 10 per second
+        self.assertGreaterEqual(self.perform_ops(manager, 2), 0.15)
+
+    def test_token_bucket_invalid(self):
+        """
+        Test token bucket invalid quota
+        """
+        with self.assertRaises(ValueError):
+            TokenBucketQuotaMgr(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
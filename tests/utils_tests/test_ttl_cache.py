@@ -0,0 +1,63 @@
+"""
+Unit tests for time to live cache functions
+"""
+from time import sleep
+import unittest
+
+from utils import ttl_lru_cache
+
+
+class TestTtlCache(unittest.TestCase):
+    """
+    Unit tests for time to live cache functions
+    """
+
+    def test_lru(self):
+        """
+        Test least recently used results discarded
+        """
+        calls = []
+
+        @ttl_lru_cache(maxsize=2)
+        def func(value):
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual(func(1), 2)
+        self.assertEqual(func(2), 4)
+        self.assertEqual(func(1), 2)
+        self.assertListEqual(calls, [1, 2])
+
+        # 2 is least recently used
+        func(3)
+        func(1)
+        self.assertListEqual(calls, [1, 2, 3])
+        func(2)
+        self.assertListEqual(calls, [1, 2, 3, 2])
+
+        func.cache_clear()
+        func(2)
+        self.assertListEqual(calls, [1, 2, 3, 2, 2])
+
+    def test_ttl(self):
+        """
+        Test results expire
+        """
+        calls = []
+
+        @ttl_lru_cache(ttl=0.05)
+        def func(value, scale=1):
+            calls.append(value)
+            return value * scale
+
+        self.assertEqual(func(1, scale=3), 3)
+        self.assertEqual(func(1, scale=3), 3)
+        self.assertEqual(len(calls), 1)
+
+        sleep(0.1)
+        self.assertEqual(func(1, scale=3), 3)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
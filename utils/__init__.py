@@ -5,8 +5,8 @@ from .input import (
     get_input, InputParam, user_confirm, get_int, valid_int_range, ControlCode
 )
 from .output import (
-    error, info, assistance, Colour, colorise, display, title, log, WrapMode,
-    spacer, Spacing, display_paginated, scrn_print
+    error, info, assistance, Colour, colorise, colour_wrap, display, title,
+    log, WrapMode, spacer, Spacing, display_paginated, scrn_print
 )
 from .menu import (
     MenuEntry, CloseMenuEntry, ProxyMenuEntry, Menu, MenuOption, pick_menu
@@ -15,7 +15,9 @@ from .misc import (
     last_day_of_month, friendly_date, filter_data_frame_by_date, DateFormat,
     convert_date_time, drill_dict
 )
-from .environ import get_env_setting, is_production, is_development
+from .environ import (
+    get_env_setting, is_production, is_development, max_workers, cache_ttl
+)
 from .constants import (
     DEFAULT_GOOGLE_CREDS_FILE, DEFAULT_GOOGLE_CREDS_PATH,
     GOOGLE_CREDS_FILE_ENV, GOOGLE_CREDS_PATH_ENV,
@@ -26,14 +28,19 @@ from .constants import (
     EXCHANGES_SHEET, COMPANIES_SHEET, EFT_SHEET, MUTUAL_SHEET,
     FUTURES_SHEET, INDEX_SHEET,
     DEFAULT_DATA_PATH, META_DATA_FOLDER, DEFAULT_HELP_PATH,
+    DEFAULT_CACHE_PATH, CACHE_PATH_ENV, DEFAULT_CACHE_TTL, CACHE_TTL_ENV,
     PAGE_UP, PAGE_DOWN, HELP, BACK_KEY, HOME_KEY,
     MAX_LINE_LEN, MAX_SCREEN_HEIGHT,
-    FRIENDLY_DATE_FMT, MAX_MULTI_ANALYSIS
+    FRIENDLY_DATE_FMT, MAX_MULTI_ANALYSIS, DEFAULT_MAX_WORKERS, MAX_WORKERS_ENV
+)
+from .comms import (
+    http_get, wrapped_get, http_session, close_http_session
 )
-from .comms import http_get, wrapped_get
 from .pagination import Pagination
+from .ttl_cache import ttl_lru_cache
 from .paths import (
-    file_path, sample_exchanges_path, sample_exchange_path, sample_meta_path
+    file_path, sample_exchanges_path, sample_exchange_path, sample_meta_path,
+    cache_path
 )
 from .quota_mgr import (
     google_read_manager, google_write_manager, rapidapi_read_manager,
@@ -56,6 +63,7 @@ __all__ = [
     'info',
     'assistance',
     'colorise',
+    'colour_wrap',
     'display',
     'title',
     'log',
@@ -82,6 +90,8 @@ __all__ = [
     'get_env_setting',
     'is_production',
     'is_development',
+    'max_workers',
+    'cache_ttl',
 
     'DEFAULT_GOOGLE_CREDS_FILE',
     'DEFAULT_GOOGLE_CREDS_PATH',
@@ -103,6 +113,10 @@ __all__ = [
     'INDEX_SHEET',
     'DEFAULT_DATA_PATH',
     'META_DATA_FOLDER',
+    'DEFAULT_CACHE_PATH',
+    'CACHE_PATH_ENV',
+    'DEFAULT_CACHE_TTL',
+    'CACHE_TTL_ENV',
     'DEFAULT_HELP_PATH',
     'PAGE_UP',
     'PAGE_DOWN',
@@ -113,16 +127,22 @@ __all__ = [
     'MAX_SCREEN_HEIGHT',
     'FRIENDLY_DATE_FMT',
     'MAX_MULTI_ANALYSIS',
+    'DEFAULT_MAX_WORKERS',
+    'MAX_WORKERS_ENV',
 
     'http_get',
     'wrapped_get',
+    'http_session',
+    'close_http_session',
 
     'Pagination',
+    'ttl_lru_cache',
 
     'file_path',
     'sample_exchanges_path',
     'sample_exchange_path',
     'sample_meta_path',
+    'cache_path',
 
     'google_read_manager',
     'google_write_manager',
@@ -3,8 +3,14 @@ HTTP communications related functions
 """
 from typing import Any, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .environ import max_workers
 from .output import error
 
+SESSION = None
+""" Shared http session """
+
 
 def _error_msg(exc: requests.exceptions.RequestException):
     """
@@ -69,6 +75,38 @@ def http_get(url: str, **kwargs) -> requests.Response:
     """
 
     def get_response() -> requests.Response:
-        return requests.get(url, **kwargs)
+        return http_session().get(url, **kwargs)
 
     return wrapped_get(get_response)
+
+
+def http_session() -> requests.Session:
+    """
+    Get the shared http session, so connections are reused across requests
+
+    Returns:
+        requests.Session: session
+    """
+    global SESSION
+    if SESSION is None:
+        # quota exceeded (429) responses are retried by the quota managers
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=max(max_workers(), 10),
+            max_retries=Retry(
+                total=3, backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504])
+        )
+        SESSION = requests.Session()
+        SESSION.mount('https://', adapter)
+        SESSION.mount('http://', adapter)
+    return SESSION
+
+
+def close_http_session():
+    """
+    Close the shared http session, releasing any pooled connections
+    """
+    global SESSION
+    if SESSION is not None:
+        SESSION.close()
+        SESSION = None
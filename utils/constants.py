@@ -46,6 +46,20 @@ Note: if a relative path is specified, it must be relative to the
       project root folder.
 """
 
+DEFAULT_CACHE_PATH = "./cache/analastock.db"
+"""
+Default path to local data cache database
+Note: if a relative path is specified, it must be relative to the
+      project root folder.
+"""
+CACHE_PATH_ENV = 'CACHE_PATH'
+""" Local data cache database path environment variable """
+
+DEFAULT_CACHE_TTL = 90
+""" Default number of days data is retained in the local data cache """
+CACHE_TTL_ENV = 'CACHE_TTL'
+""" Local data cache time to live environment variable """
+
 META_DATA_FOLDER = "meta"
 """ Folder under data path where meta-data samples are stored """
 
@@ -103,3 +117,8 @@ Max backoff time for truncated exponential backoff retry environment variable
 
 MAX_MULTI_ANALYSIS = 3
 """ Max number of stocks to compare in multi analysis """
+
+DEFAULT_MAX_WORKERS = 8
+""" Max number of worker threads for concurrent I/O operations """
+MAX_WORKERS_ENV = 'MAX_WORKERS'
+""" Max number of worker threads environment variable """
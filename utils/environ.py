@@ -2,8 +2,13 @@
 Environment related functions
 """
 import os
+from datetime import timedelta
 from typing import Any, Union
 
+from .constants import (
+    DEFAULT_MAX_WORKERS, MAX_WORKERS_ENV, DEFAULT_CACHE_TTL, CACHE_TTL_ENV
+)
+
 
 def get_env_setting(
         key: str, default_value: Any = None,
@@ -71,3 +76,30 @@ def is_truthy(text: Union[str, int]) -> bool:
     elif isinstance(text, str):
         value = True if text.lower() in ['y', 'yes', 'true'] else False
     return value
+
+
+def max_workers(num_tasks: int = None) -> int:
+    """
+    Get the max number of worker threads for concurrent I/O operations
+
+    Args:
+        num_tasks (int, optional):
+            number of tasks to be performed. Defaults to None.
+
+    Returns:
+        int: number of worker threads
+    """
+    workers = max(
+        int(get_env_setting(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS)), 1)
+    return min(workers, num_tasks) if num_tasks else workers
+
+
+def cache_ttl() -> timedelta:
+    """
+    Get the time to live of data in the local data cache
+
+    Returns:
+        timedelta: time to live
+    """
+    return timedelta(
+        days=max(int(get_env_setting(CACHE_TTL_ENV, DEFAULT_CACHE_TTL)), 0))
@@ -185,6 +185,24 @@ class Menu:
         """
         self.entries = entries
 
+    def reset(self):
+        """
+        Reset the menu display state, so a menu may be reused
+        """
+        self.is_open = False
+        self._start = 0
+        self._end = self.display_rows
+        self._page_keys.clear()
+
+    def set_title(self, menu_title: str):
+        """
+        Set the menu title
+
+        Args:
+            menu_title (str): title to display
+        """
+        self.title = menu_title if menu_title else ''
+
     def add_entry(self, entry: MenuEntry) -> bool:
         """
         Add an entry to the menu
@@ -458,6 +476,24 @@ class Menu:
 
         return self.entries[index]
 
+    def run_until_closed(self) -> Any:
+        """
+        Process the menu until it is closed
+
+        Returns:
+            Any: Result of last selected option's call function or None
+        """
+        self.reset()
+
+        result = None
+        loop: bool = True
+        while loop:
+            result = self.process()
+
+            loop = self.is_open
+
+        return result
+
     def set_up_down_hook(
             self, up_down_hook: Callable[[object, int, int], None]):
         """
@@ -623,13 +659,8 @@ def pick_menu(
 
     for text, value in entries:
         menu.add_entry(
-            CloseMenuEntry(text, lambda: value)
+            # bind value at definition, not the last value of the loop
+            CloseMenuEntry(text, lambda choice=value: choice)
         )
 
-    loop: bool = True
-    while loop:
-        result = menu.process()
-
-        loop = menu.is_open
-
-    return result
+    return menu.run_until_closed()
@@ -3,6 +3,7 @@ Output related functions
 """
 import re
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Generator, Union, List, Tuple
 
 from termcolor import colored
@@ -18,6 +19,9 @@ FORMATTING = re.compile(r'{(.*?):?([<>^]?):?(\w+)}')
 
 SCRN_PRINT_DEBUG = False
 
+_WRAP_MARK = '\0'
+""" Placeholder message to find control chars added by colorise """
+
 
 class Colour(Enum):
     """ Class representing available text colours """
@@ -242,6 +246,25 @@ def colorise(msg: str, colour: Colour = None, on_colour: Colour = None) -> str:
     )
 
 
+@lru_cache(maxsize=64)
+def colour_wrap(
+        colour: Colour = None, on_colour: Colour = None) -> Tuple[str, str]:
+    """
+    Get the control chars added by colorise, so a message string may be
+    coloured by concatenation
+
+    Args:
+        colour (Colour, optional): text colour. Defaults to None.
+        on_colour (Colour, optional): background colour. Defaults to None.
+
+    Returns:
+        Tuple[str, str]: tuple of prefix and suffix control chars
+    """
+    prefix, suffix = colorise(
+        _WRAP_MARK, colour=colour, on_colour=on_colour).split(_WRAP_MARK)
+    return prefix, suffix
+
+
 def display(msg: str, colour: Colour = None, on_colour: Colour = None,
             pre_spc: Spacing = Spacing.NONE, post_spc: Spacing = Spacing.NONE):
     """
@@ -17,6 +17,8 @@ class Pagination:
     """ Number of items per page """
     transform_func: Callable[[List[Any]], List[Any]]
     """ Function to transform items to return """
+    _page_cache: dict
+    """ Transformed items by page number """
 
     def __init__(
             self, items: List[Any], page_size: int = 10,
@@ -32,12 +34,29 @@ class Pagination:
         Args:
             page_size (int): page size
         """
+        if page_size != getattr(self, 'page_size', None):
+            # transformed pages only valid for the same page size
+            self._page_cache = {}
         self.page_size = page_size
         self.num_pages = int(len(self.items) / page_size)
         if self.num_pages * page_size < len(self.items):
             self.num_pages += 1
         self.page_num = 1
 
+    def copy(self) -> object:
+        """
+        Copy this pagination. The copy has independent page state, but
+        shares the items and the transformed pages of this object.
+
+        Returns:
+            Pagination: new object
+        """
+        pagination = Pagination(
+            self.items, page_size=self.page_size,
+            transform_func=self.transform_func)
+        pagination._page_cache = self._page_cache
+        return pagination
+
     def get_page(self, page_num: int,
                  transform: bool = True) -> Union[List[Any], None]:
         """
@@ -53,16 +72,33 @@ class Pagination:
         """
         page_items = None
         if 1 <= page_num <= self.num_pages:
-            start = (page_num - 1) * self.page_size
-            end = page_num * self.page_size
-            page_items = self.items[start:end]
             self.page_num = page_num
 
             if transform and self.transform_func:
-                page_items = self.transform_func(page_items)
+                if page_num not in self._page_cache:
+                    # transformed pages are cached as transform may be slow
+                    self._page_cache[page_num] = \
+                        self.transform_func(self._page_items(page_num))
+                page_items = self._page_cache[page_num]
+            else:
+                page_items = self._page_items(page_num)
 
         return page_items
 
+    def _page_items(self, page_num: int) -> List[Any]:
+        """
+        Get the untransformed items for the specified page
+
+        Args:
+            page_num (int): number of page to get (one-based)
+
+        Returns:
+            List[Any]: items
+        """
+        start = (page_num - 1) * self.page_size
+        end = page_num * self.page_size
+        return self.items[start:end]
+
     def get_current_page(self, transform: bool = True) -> List[Any]:
         """
         Get the items for the current page
@@ -2,7 +2,9 @@
 Functions related to file paths
 """
 import os
-from .constants import DEFAULT_DATA_PATH, META_DATA_FOLDER
+from .constants import (
+    DEFAULT_DATA_PATH, META_DATA_FOLDER, DEFAULT_CACHE_PATH, CACHE_PATH_ENV
+)
 from .environ import get_env_setting
 
 SAMPLE_EXCHANGES_DATA = 'sample_exchanges.json'
@@ -66,3 +68,15 @@ def sample_meta_path(symbol: str) -> str:
         META_DATA_FOLDER,
         SAMPLE_META_DATA.format(symbol=symbol)
     )
+
+
+def cache_path() -> str:
+    """
+    Get the path to the local data cache database
+
+    Returns:
+        str: path to file
+    """
+    return file_path(
+        get_env_setting(CACHE_PATH_ENV, DEFAULT_CACHE_PATH)
+    )
@@ -4,7 +4,7 @@ Functions related to Google quota management
 from datetime import datetime
 from enum import Enum, auto
 from threading import RLock
-from time import perf_counter_ns, sleep
+from time import perf_counter, perf_counter_ns, sleep
 from typing import Union, Callable, Any, Tuple
 from random import randint
 
@@ -32,42 +32,57 @@ class TimeUnit(Enum):
 
 class QuotaMgr:
     """
-    Class representing a quota manger
+    Class representing a quota manger.
+    The lock is only held while pacing operations, not while they are
+    performed, so operations may be performed concurrently.
     """
 
     _lock: RLock
     """ Lock """
     # https://docs.python.org/3/library/threading.html?highlight=rlock#threading.RLock
-    _current_wait: int
     _wait_multiplier: int
     _max_wait: int
+    _pause_end: float
+    """ End of pause in operations after backoff """
 
     def __init__(self, quota: int) -> None:
         """
         Constructor
         """
         self.lock = RLock()
+        self._pause_end = 0
         self.init_backoff()
 
     def init_backoff(self):
-        self._current_wait = 1
         self._wait_multiplier = 2
         self._max_wait = int(
             get_env_setting(MAX_BACKOFF_ENV, DEFAULT_MAX_BACKOFF))
 
     def acquire(self):
         """
-        Acquire the lock.
+        Wait until an operation may begin.
         Note: Must be called before operation begins
         """
-        self.lock.acquire()
+        with self.lock:
+            pause = self._pause_end - perf_counter()
+        if pause > 0:
+            # backoff in progress
+            sleep(pause)
+
+        with self.lock:
+            wait = self._pace()
+        if wait > 0:
+            # throttle to not exceed rate
+            sleep(wait)
 
-    def release(self):
+    def _pace(self) -> float:
         """
-        Release the lock.
-        Note: Must be called after operation ends
+        Reserve the next operation. Called with the lock held.
+
+        Returns:
+            float: seconds to wait before operation begins
         """
-        self.lock.release()
+        return 0
 
     def perform(self,
                 operation_func: Callable[[], Any],
@@ -87,6 +102,9 @@ class QuotaMgr:
         """
         op_result = None
         loop = True
+        # backoff state is per operation, as operations may be performed
+        # concurrently
+        current_wait = 1
 
         while loop:
             try:
@@ -97,57 +115,57 @@ class QuotaMgr:
                     if success:
                         # success
                         loop = False
-                        self.init_backoff()
-                    elif self.backoff(msg):
+                    elif self.backoff(msg, wait=current_wait):
                         # operation failed
                         error('Aborting operation')
                         loop = False
                 else:
                     # no check, return response
                     loop = False
-                    self.init_backoff()
             except gspread.exceptions.APIError as exc:
                 _, msg = check_429_func(exc.response)
-                if self.backoff(f'Google Sheets: {msg}'):
+                if self.backoff(f'Google Sheets: {msg}', wait=current_wait):
                     error('Aborting operation')
                     loop = False
+            current_wait *= self._wait_multiplier
 
         return op_result
 
-    def backoff(self, msg: str = None) -> bool:
+    def backoff(self, msg: str = None, wait: int = 1) -> bool:
         """
         Perform a Truncated exponential backoff
         https://cloud.google.com/storage/docs/retry-strategy#python
 
         Args:
             msg (str, optional): message to display
+            wait (int, optional): seconds to wait. Defaults to 1.
 
         Returns
             bool: True is backoff truncated, false otherwise
         """
         info(f'{f"{msg}. "  if msg else ""}'
-             f'Will retry in {self._current_wait} second'
-             f'{"s" if self._current_wait > 1 else ""}.')
-        sleep(self._current_wait + (randint(100, 1000) / 1000))
-        self._current_wait *= self._wait_multiplier
-
-        truncate = self._current_wait > self._max_wait
-        if truncate:
-            self.init_backoff()
+             f'Will retry in {wait} second'
+             f'{"s" if wait > 1 else ""}.')
+        wait_secs = wait + (randint(100, 1000) / 1000)
+        with self.lock:
+            # pause other operations until the retry
+            self._pause_end = max(self._pause_end, perf_counter() + wait_secs)
+        sleep(wait_secs)
 
-        return truncate
+        return wait * self._wait_multiplier > self._max_wait
 
 
 class LevelQuotaMgr(QuotaMgr):
     """
-    Class representing a quota manger which ensures each operation takes
-    the max allowed time, to prevent exceeding quota
+    Class representing a quota manger which ensures operations begin at
+    intervals of the max allowed time per operation, to prevent exceeding
+    quota
     """
 
     _ns_per_op: int
     """ Nanoseconds per operation """
-    _start: int
-    """ Start point of current operation """
+    _next_start: int
+    """ Start point of next operation """
 
     def __init__(self, quota: int, unit: TimeUnit = TimeUnit.MINUTE) -> None:
         """
@@ -175,25 +193,19 @@ class LevelQuotaMgr(QuotaMgr):
         else:
             raise ValueError(f'Invalid unit: {unit}')
 
-    def acquire(self):
-        """
-        Acquire the lock.
-        Note: Must be called before operation begins
-        """
-        super(LevelQuotaMgr, self).acquire()
-        self._start = perf_counter_ns()
+        self._next_start = 0
 
-    def release(self):
-        """
-        Release the lock.
-        Note: Must be called after operation ends
+    def _pace(self) -> float:
         """
-        duration = perf_counter_ns() - self._start
-        if duration < self._ns_per_op:
-            # throttle to not exceed rate
-            sleep((self._ns_per_op - duration) / 10 ** 9)
+        Reserve the next operation. Called with the lock held.
 
-        super(LevelQuotaMgr, self).release()
+        Returns:
+            float: seconds to wait before operation begins
+        """
+        now = perf_counter_ns()
+        start = max(now, self._next_start)
+        self._next_start = start + self._ns_per_op
+        return (start - now) / 10 ** 9
 
 
 class RateQuotaMgr(QuotaMgr):
@@ -249,34 +261,127 @@ class RateQuotaMgr(QuotaMgr):
 
         self._reset()
 
-    def _reset(self):
-        """ Reset the current period """
-        self._start = datetime.now().timestamp()
+    def _reset(self, start: float = None):
+        """
+        Reset the current period
+
+        Args:
+            start (float, optional): start of period timestamp.
+                                    Defaults to now.
+        """
+        self._start = start if start else datetime.now().timestamp()
         self._end = self._start + (
             1 if self._unit == TimeUnit.SECOND else
             60 if self._unit == TimeUnit.MINUTE else 3600)
         self._count = 0
 
-    def acquire(self):
+    def _pace(self) -> float:
         """
-        Acquire the lock.
-        Note: Must be called before operation begins
+        Reserve the next operation. Called with the lock held.
+
+        Returns:
+            float: seconds to wait before operation begins
         """
-        super(RateQuotaMgr, self).acquire()
-        if datetime.now().timestamp() >= self._end:
+        wait = 0
+        now = datetime.now().timestamp()
+        if now >= self._end:
             self._reset()
+        elif self._count >= self._limit:
+            # limit reached for current period, wait for next period
+            wait = self._end - now
+            self._reset(self._end)
         self._count += 1
+        return wait
+
+
+class TokenBucketQuotaMgr(QuotaMgr):
+    """
+    Class representing a quota manger which uses a token bucket to limit
+    the rate of operations. Operations proceed immediately while tokens
+    are available, and the refill rate is halved for a period after a
+    quota exceeded response, to prevent exceeding quota
+    """
+
+    THROTTLE_SECS: int = 60
+    """ Number of seconds refill rate is reduced after backoff """
+
+    _capacity: float
+    """ Max number of tokens """
+    _tokens: float
+    """ Number of tokens currently available """
+    _rate: float
+    """ Token refill rate per second """
+    _last: float
+    """ Time of last refill """
+    _throttle_end: float
+    """ End of reduced refill rate period """
+
+    def __init__(self, quota: int, unit: TimeUnit = TimeUnit.MINUTE) -> None:
+        """
+        Constructor
+
+        Args:
+            quota (int): quota
+            unit (TimeUnit, optional):
+                    time unit of quota. Defaults to TimeUnit.MINUTE.
+
+        Raises:
+            ValueError: if invalid quota
+        """
+        super(TokenBucketQuotaMgr, self).__init__(quota)
+        if unit in TimeUnit:
+            quota = int(quota)
+            if quota <= 0:
+                raise ValueError(f'Invalid quota: {quota} {unit}')
+
+            self._capacity = float(quota)
+            self._rate = quota / (
+                1 if unit == TimeUnit.SECOND else
+                60 if unit == TimeUnit.MINUTE else 3600)
+        else:
+            raise ValueError(f'Invalid unit: {unit}')
+
+        self._tokens = self._capacity
+        self._last = perf_counter()
+        self._throttle_end = 0
+
+    def _refill(self):
+        """ Add tokens accumulated since the last refill """
+        now = perf_counter()
+        rate = self._rate / 2 if now < self._throttle_end else self._rate
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last) * rate)
+        self._last = now
+        return rate
 
-    def release(self):
+    def _pace(self) -> float:
         """
-        Release the lock.
-        Note: Must be called after operation ends
+        Reserve the next operation. Called with the lock held.
+
+        Returns:
+            float: seconds to wait before operation begins
         """
-        if self._count >= self._limit:
-            # throttle to not exceed rate
-            sleep(self._end - datetime.now().timestamp())
+        rate = self._refill()
+        # tokens may be reserved before they are available, so concurrent
+        # operations wait in turn for the refill
+        self._tokens -= 1
+        return -self._tokens / rate if self._tokens < 0 else 0
 
-        super(RateQuotaMgr, self).release()
+    def backoff(self, msg: str = None, wait: int = 1) -> bool:
+        """
+        Perform a Truncated exponential backoff, and reduce the refill rate
+
+        Args:
+            msg (str, optional): message to display
+            wait (int, optional): seconds to wait. Defaults to 1.
+
+        Returns
+            bool: True is backoff truncated, false otherwise
+        """
+        with self.lock:
+            self._throttle_end = perf_counter() + self.THROTTLE_SECS
+            self._tokens = min(self._tokens, 0)
+        return super(TokenBucketQuotaMgr, self).backoff(msg, wait=wait)
 
 
 MANAGERS = {}
@@ -295,6 +400,7 @@ def get_manager(name: str) -> Union[LevelQuotaMgr, RateQuotaMgr]:
     if name not in MANAGERS:
         setting = get_env_setting('QUOTA_MGR', 'RateQuotaMgr').lower()
         Manager = LevelQuotaMgr if setting == 'levelquotamgr' else \
+            TokenBucketQuotaMgr if setting == 'tokenbucketquotamgr' else \
             QuotaMgr if setting == 'quotamgr' else RateQuotaMgr
 
         MANAGERS['google-read'] = Manager(
@@ -0,0 +1,59 @@
+"""
+Time to live cache related functions
+"""
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+
+def ttl_lru_cache(maxsize: int = 128, ttl: float = None) -> Callable:
+    """
+    Decorator to cache function results, least recently used results are
+    discarded when full and results expire after the time to live.
+    Similar to functools.lru_cache, the wrapped function has a
+    ``cache_clear`` function to clear the cache.
+
+    Args:
+        maxsize (int, optional): max number of results cached.
+                                Defaults to 128.
+        ttl (float, optional): time to live in seconds, or None if results
+                            don't expire. Defaults to None.
+
+    Returns:
+        Callable: decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = OrderedDict()
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = monotonic()
+            with lock:
+                if key in cache:
+                    expiry, result = cache[key]
+                    if expiry is None or now < expiry:
+                        cache.move_to_end(key)
+                        return result
+                    del cache[key]
+
+            result = func(*args, **kwargs)
+
+            with lock:
+                cache[key] = (None if ttl is None else now + ttl, result)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator